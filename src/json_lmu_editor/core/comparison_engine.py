@@ -4,15 +4,18 @@ Configuration comparison engine.
 Provides functionality to compare two configurations and identify differences.
 """
 
+from collections import Counter, defaultdict
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Dict, Any
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 import logging
 
 from .parsers.json_parser import FieldType
 
 
-class DifferenceType(Enum):
+class DifferenceType(StrEnum):
     """Types of differences between configurations."""
 
     VALUE_CHANGED = "value_changed"
@@ -21,7 +24,7 @@ class DifferenceType(Enum):
     FIELD_REMOVED = "field_removed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Difference:
     """Represents a difference between two configuration values."""
 
@@ -35,6 +38,44 @@ class Difference:
     description: str = ""
 
 
+_DISPLAY_TRUNCATE_LENGTH = 50
+
+
+def _format_default(value: Any) -> str:
+    """Format a value as a string, truncated for display."""
+    str_value = str(value)
+    if len(str_value) > _DISPLAY_TRUNCATE_LENGTH:
+        return str_value[:_DISPLAY_TRUNCATE_LENGTH] + "..."
+    return str_value
+
+
+def _format_boolean(value: Any) -> str:
+    """Format a boolean value for display."""
+    return "Yes" if value else "No"
+
+
+def _format_array(value: Any) -> str:
+    """Format an array value for display as its item count."""
+    if isinstance(value, (list, tuple)):
+        return f"[{len(value)} items]"
+    return _format_default(value)
+
+
+def _format_float(value: Any) -> str:
+    """Format a float value for display."""
+    if isinstance(value, float):
+        return f"{value:.6g}"  # Use general format to avoid unnecessary decimals
+    return str(value)
+
+
+# Display formatters by field type; other types use _format_default
+_VALUE_FORMATTERS = {
+    FieldType.BOOLEAN: _format_boolean,
+    FieldType.ARRAY: _format_array,
+    FieldType.FLOAT: _format_float,
+}
+
+
 class ComparisonEngine:
     """Engine for comparing configurations and identifying differences."""
 
@@ -55,84 +96,92 @@ class ComparisonEngine:
         Returns:
             List of differences found
         """
-        differences = []
+        # A configuration compared with itself has no differences
+        if config1_data is config2_data:
+            self.logger.info("Found 0 differences between configurations")
+            return []
 
-        # Get all field paths from both configurations
-        all_paths = set(config1_data.keys()) | set(config2_data.keys())
-
-        for field_path in all_paths:
-            field1 = config1_data.get(field_path)
-            field2 = config2_data.get(field_path)
-
-            # Field only in config1
-            if field1 and not field2:
-                differences.append(
-                    Difference(
-                        field_path=field_path,
-                        field_name=self._get_field_name(field_path),
-                        category=field1.category,
-                        difference_type=DifferenceType.FIELD_REMOVED,
-                        value1=field1.value,
-                        value2=None,
-                        field_type=field1.type,
-                        description=field1.description or "",
-                    )
+        differences = []
+        append = differences.append
+        get_field_name = self._get_field_name
+        values_equal = self._values_equal
+        field_removed = DifferenceType.FIELD_REMOVED
+        field_added = DifferenceType.FIELD_ADDED
+        type_changed = DifferenceType.TYPE_CHANGED
+        value_changed = DifferenceType.VALUE_CHANGED
+
+        # Partition field paths up front instead of probing both sides per path
+        paths1 = config1_data.keys()
+        paths2 = config2_data.keys()
+
+        # Fields only in config1
+        for field_path in paths1 - paths2:
+            field1 = config1_data[field_path]
+            append(
+                Difference(
+                    field_path=field_path,
+                    field_name=get_field_name(field_path),
+                    category=field1.category,
+                    difference_type=field_removed,
+                    value1=field1.value,
+                    value2=None,
+                    field_type=field1.type,
+                    description=field1.description or "",
                 )
-
-            # Field only in config2
-            elif field2 and not field1:
-                differences.append(
-                    Difference(
-                        field_path=field_path,
-                        field_name=self._get_field_name(field_path),
-                        category=field2.category,
-                        difference_type=DifferenceType.FIELD_ADDED,
-                        value1=None,
-                        value2=field2.value,
-                        field_type=field2.type,
-                        description=field2.description or "",
-                    )
+            )
+
+        # Fields only in config2
+        for field_path in paths2 - paths1:
+            field2 = config2_data[field_path]
+            append(
+                Difference(
+                    field_path=field_path,
+                    field_name=get_field_name(field_path),
+                    category=field2.category,
+                    difference_type=field_added,
+                    value1=None,
+                    value2=field2.value,
+                    field_type=field2.type,
+                    description=field2.description or "",
                 )
-
-            # Field in both configurations
-            elif field1 and field2:
-                # Check if types differ
-                if field1.type != field2.type:
-                    differences.append(
-                        Difference(
-                            field_path=field_path,
-                            field_name=self._get_field_name(field_path),
-                            category=field1.category,
-                            difference_type=DifferenceType.TYPE_CHANGED,
-                            value1=field1.value,
-                            value2=field2.value,
-                            field_type=field1.type,
-                            description=field1.description or "",
-                        )
-                    )
-
-                # Check if values differ
-                elif not self._values_equal(field1.value, field2.value):
-                    differences.append(
-                        Difference(
-                            field_path=field_path,
-                            field_name=self._get_field_name(field_path),
-                            category=field1.category,
-                            difference_type=DifferenceType.VALUE_CHANGED,
-                            value1=field1.value,
-                            value2=field2.value,
-                            field_type=field1.type,
-                            description=field1.description or "",
-                        )
-                    )
+            )
+
+        # Fields in both configurations
+        for field_path in paths1 & paths2:
+            field1 = config1_data[field_path]
+            field2 = config2_data[field_path]
+
+            # Check if types differ
+            if field1.type != field2.type:
+                difference_type = type_changed
+            # Check if values differ
+            elif not values_equal(field1.value, field2.value):
+                difference_type = value_changed
+            else:
+                continue
+
+            append(
+                Difference(
+                    field_path=field_path,
+                    field_name=get_field_name(field_path),
+                    category=field1.category,
+                    difference_type=difference_type,
+                    value1=field1.value,
+                    value2=field2.value,
+                    field_type=field1.type,
+                    description=field1.description or "",
+                )
+            )
 
         # Sort differences by category and field name
-        differences.sort(key=lambda d: (d.category, d.field_name))
+        differences.sort(key=attrgetter("category", "field_name"))
 
         self.logger.info(f"Found {len(differences)} differences between configurations")
         return differences
 
-    def _get_field_name(self, field_path: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _get_field_name(field_path: str) -> str:
         """
         Extract display name from field path.
 
@@ -142,7 +191,7 @@ class ComparisonEngine:
         Returns:
             Display name
         """
-        return field_path.split(".")[-1]
+        return field_path.rpartition(".")[2]
 
     def _values_equal(self, value1: Any, value2: Any) -> bool:
         """
@@ -155,9 +204,31 @@ class ComparisonEngine:
         Returns:
             True if values are considered equal
         """
-        # Handle None values
-        if value1 is None and value2 is None:
+        # Identical objects (None, interned strings, small ints, bools) are equal
+        if value1 is value2:
             return True
+
+        # Same-type scalars are the common case
+        value_type = type(value1)
+        if value_type is type(value2):
+            if value_type is str:
+                return value1.strip() == value2.strip()
+            if value_type is float:
+                return abs(value1 - value2) < 1e-10
+            if value_type is int or value_type is bool:
+                return value1 == value2
+
+        # Handle list/tuple comparisons
+        if isinstance(value1, (list, tuple)) and isinstance(value2, (list, tuple)):
+            if len(value1) != len(value2):
+                return False
+            # C-level elementwise equality settles the common case; only a
+            # mismatch needs the per-element rules (float tolerance, stripping)
+            if value1 == value2:
+                return True
+            return all(self._values_equal(v1, v2) for v1, v2 in zip(value1, value2))
+
+        # Handle None values
         if value1 is None or value2 is None:
             return False
 
@@ -172,16 +243,6 @@ class ComparisonEngine:
         if isinstance(value1, str) and isinstance(value2, str):
             return value1.strip() == value2.strip()
 
-        # Handle boolean comparisons
-        if isinstance(value1, bool) and isinstance(value2, bool):
-            return value1 == value2
-
-        # Handle list/tuple comparisons
-        if isinstance(value1, (list, tuple)) and isinstance(value2, (list, tuple)):
-            if len(value1) != len(value2):
-                return False
-            return all(self._values_equal(v1, v2) for v1, v2 in zip(value1, value2))
-
         # Default comparison
         return value1 == value2
 
@@ -197,15 +258,13 @@ class ComparisonEngine:
         Returns:
             Dictionary mapping categories to differences
         """
-        categorized = {}
+        categorized = defaultdict(list)
 
         for diff in differences:
-            category = diff.category
-            if category not in categorized:
-                categorized[category] = []
-            categorized[category].append(diff)
+            categorized[diff.category].append(diff)
 
-        return categorized
+        # Plain dict so lookups of missing categories don't insert them
+        return dict(categorized)
 
     def format_value_for_display(self, value: Any, field_type: FieldType) -> str:
         """
@@ -221,23 +280,7 @@ class ComparisonEngine:
         if value is None:
             return "(not set)"
 
-        if field_type == FieldType.BOOLEAN:
-            return "Yes" if value else "No"
-        elif field_type == FieldType.ARRAY:
-            if isinstance(value, (list, tuple)):
-                return f"[{len(value)} items]"
-            else:
-                return str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
-        elif field_type == FieldType.FLOAT:
-            if isinstance(value, float):
-                return (
-                    f"{value:.6g}"  # Use general format to avoid unnecessary decimals
-                )
-            else:
-                return str(value)
-        else:
-            str_value = str(value)
-            return str_value[:50] + "..." if len(str_value) > 50 else str_value
+        return _VALUE_FORMATTERS.get(field_type, _format_default)(value)
 
     def get_difference_summary(self, differences: List[Difference]) -> Dict[str, int]:
         """
@@ -249,22 +292,10 @@ class ComparisonEngine:
         Returns:
             Dictionary with difference counts by type
         """
-        summary = {
-            "total": len(differences),
-            "value_changed": 0,
-            "type_changed": 0,
-            "field_added": 0,
-            "field_removed": 0,
-        }
+        counts = Counter(diff.difference_type for diff in differences)
 
-        for diff in differences:
-            if diff.difference_type == DifferenceType.VALUE_CHANGED:
-                summary["value_changed"] += 1
-            elif diff.difference_type == DifferenceType.TYPE_CHANGED:
-                summary["type_changed"] += 1
-            elif diff.difference_type == DifferenceType.FIELD_ADDED:
-                summary["field_added"] += 1
-            elif diff.difference_type == DifferenceType.FIELD_REMOVED:
-                summary["field_removed"] += 1
+        summary = {"total": len(differences)}
+        for difference_type in DifferenceType:
+            summary[difference_type.value] = counts[difference_type]
 
         return summary
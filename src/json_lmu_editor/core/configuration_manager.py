@@ -4,6 +4,7 @@ Configuration manager for saving, loading, and managing multiple configurations.
 Handles the file operations for saved configurations following the LMU naming convention.
 """
 
+import errno
 import json
 import shutil
 import os
@@ -12,6 +13,11 @@ from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime
 import logging
 
+try:
+    import orjson
+except ImportError:  # Optional; the standard json module is used instead
+    orjson = None
+
 from .models.configuration_model import ConfigurationModel
 from .parsers.json_parser import JsonWithCommentsParser
 from .parsers.ini_parser import IniParser
@@ -40,8 +46,15 @@ class ConfigurationManager:
         # Metadata file for descriptions and timestamps (in AppData)
         self.metadata_file = self.saved_configs_dir / "lmu_config_metadata.json"
 
-        # Load existing metadata
-        self.metadata = self._load_metadata()
+        # Saved configuration names with the directory mtime they were listed at
+        self._configs_cache: Optional[Tuple[int, List[str]]] = None
+
+        # File paths per configuration name, see get_configuration_files
+        self._path_cache: Dict[str, Tuple[Path, Path]] = {}
+
+        # Existing metadata, loaded on first access, and the file mtime it was read at
+        self._metadata: Optional[Dict[str, Any]] = None
+        self._metadata_mtime_ns: Optional[int] = None
 
     def _get_saved_configs_dir(self) -> Path:
         """
@@ -60,6 +73,27 @@ class ConfigurationManager:
         
         return configs_dir
 
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Configuration metadata, re-read from disk only when the file has changed."""
+        mtime = self._get_metadata_mtime()
+        if self._metadata is None or mtime != self._metadata_mtime_ns:
+            self._metadata = self._load_metadata()
+            self._metadata_mtime_ns = mtime
+        return self._metadata
+
+    def _get_metadata_mtime(self) -> Optional[int]:
+        """
+        Get the metadata file's modification time.
+
+        Returns:
+            Modification time in nanoseconds, or None if the file is missing
+        """
+        try:
+            return os.stat(self.metadata_file).st_mtime_ns
+        except OSError:
+            return None
+
     def _load_metadata(self) -> Dict[str, Any]:
         """
         Load configuration metadata from file.
@@ -69,8 +103,9 @@ class ConfigurationManager:
         """
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                with open(self.metadata_file, "rb") as f:
+                    data = f.read()
+                return orjson.loads(data) if orjson else json.loads(data)
             except Exception as e:
                 self.logger.warning(f"Failed to load metadata: {e}")
 
@@ -87,13 +122,27 @@ class ConfigurationManager:
         Returns:
             True if successful
         """
+        # Write beside the real file and swap it in, so an interrupted write
+        # never leaves a truncated metadata file behind
+        tmp_file = self.metadata_file.with_name(self.metadata_file.name + ".tmp")
         try:
-            self.metadata["last_updated"] = datetime.now().isoformat()
-            with open(self.metadata_file, "w", encoding="utf-8") as f:
-                json.dump(self.metadata, f, indent=2)
+            # Save the in-memory copy as is; going through the property could
+            # reload it from disk and drop the caller's changes
+            metadata = self._metadata if self._metadata is not None else self.metadata
+            metadata["last_updated"] = datetime.now().isoformat()
+            if orjson:
+                with open(tmp_file, "wb") as f:
+                    f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(metadata, f, indent=2)
+            os.replace(tmp_file, self.metadata_file)
+            # Our own write is already in memory, so don't re-read it
+            self._metadata_mtime_ns = self._get_metadata_mtime()
             return True
         except Exception as e:
             self.logger.error(f"Failed to save metadata: {e}")
+            tmp_file.unlink(missing_ok=True)
             return False
 
     def get_saved_configurations(self) -> List[str]:
@@ -103,19 +152,32 @@ class ConfigurationManager:
         Returns:
             List of configuration names
         """
-        configurations = []
-
-        # Look for configuration files matching pattern
-        for json_file in self.saved_configs_dir.glob("conf_*_settings.json"):
-            # Extract name from filename
-            name = json_file.stem.replace("conf_", "").replace("_settings", "")
-
-            # Check if corresponding INI file exists
-            ini_file = self.saved_configs_dir / f"conf_{name}_Config_DX11.ini"
-            if ini_file.exists():
-                configurations.append(name)
-
-        return sorted(configurations)
+        # Adding or removing files updates the directory mtime, so an unchanged
+        # mtime means the listing is still valid
+        mtime = os.stat(self.saved_configs_dir).st_mtime_ns
+        if self._configs_cache and self._configs_cache[0] == mtime:
+            return list(self._configs_cache[1])
+
+        json_names = set()
+        ini_names = set()
+
+        # Collect names from both file patterns in a single directory pass
+        with os.scandir(self.saved_configs_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                if not filename.startswith("conf_"):
+                    continue
+                # Slice the name out between "conf_" and the suffix; the length
+                # checks keep the prefix and suffix from overlapping
+                if filename.endswith("_settings.json") and len(filename) >= 19:
+                    json_names.add(filename[5:-14])
+                elif filename.endswith("_Config_DX11.ini") and len(filename) >= 21:
+                    ini_names.add(filename[5:-16])
+
+        # A configuration needs both its JSON and INI file
+        configurations = sorted(json_names & ini_names)
+        self._configs_cache = (mtime, configurations)
+        return list(configurations)
 
     def save_configuration(
         self, name: str, model: ConfigurationModel
@@ -131,12 +193,7 @@ class ConfigurationManager:
             True if successful
         """
         try:
-            # Generate filenames
-            json_filename = f"conf_{name}_settings.json"
-            ini_filename = f"conf_{name}_Config_DX11.ini"
-
-            json_path = self.saved_configs_dir / json_filename
-            ini_path = self.saved_configs_dir / ini_filename
+            json_path, ini_path = self.get_configuration_files(name)
 
             # Create backups if files exist
             self._create_backup_if_exists(json_path)
@@ -162,8 +219,8 @@ class ConfigurationManager:
             self.metadata["configurations"][name] = {
                 "description": "", # Description removed
                 "created": datetime.now().isoformat(),
-                "json_file": json_filename,
-                "ini_file": ini_filename,
+                "json_file": json_path.name,
+                "ini_file": ini_path.name,
             }
 
             # Save metadata
@@ -172,6 +229,7 @@ class ConfigurationManager:
                     "Failed to save metadata, but configuration files were saved"
                 )
 
+            self._configs_cache = None
             self.logger.info(f"Successfully saved configuration '{name}'")
             return True
 
@@ -192,27 +250,18 @@ class ConfigurationManager:
             Tuple of (success, error_message)
         """
         try:
-            # Check if configuration exists
-            if name not in self.get_saved_configurations():
+            # Check the configuration's own files rather than listing them all
+            json_path, ini_path = self.get_configuration_files(name)
+            if not json_path.is_file() or not ini_path.is_file():
                 return False, f"Configuration '{name}' not found"
 
-            # Get file paths
-            json_path = self.saved_configs_dir / f"conf_{name}_settings.json"
-            ini_path = self.saved_configs_dir / f"conf_{name}_Config_DX11.ini"
-
-            # Verify files exist
-            if not json_path.exists():
-                return False, f"JSON file not found: {json_path}"
-            if not ini_path.exists():
-                return False, f"INI file not found: {ini_path}"
-
             # Create backups of current active files
             self._create_backup_if_exists(self.active_json_file, suffix=".before_load")
             self._create_backup_if_exists(self.active_ini_file, suffix=".before_load")
 
             # Copy saved files to active locations
-            shutil.copy2(json_path, self.active_json_file)
-            shutil.copy2(ini_path, self.active_ini_file)
+            self._fast_copy(json_path, self.active_json_file)
+            self._fast_copy(ini_path, self.active_ini_file)
 
             self.logger.info(f"Successfully loaded configuration '{name}'")
             return True, None
@@ -234,14 +283,13 @@ class ConfigurationManager:
         """
         try:
             # Get file paths
-            json_path = self.saved_configs_dir / f"conf_{name}_settings.json"
-            ini_path = self.saved_configs_dir / f"conf_{name}_Config_DX11.ini"
+            json_path, ini_path = self.get_configuration_files(name)
 
             # Delete files
-            if json_path.exists():
-                json_path.unlink()
-            if ini_path.exists():
-                ini_path.unlink()
+            json_path.unlink(missing_ok=True)
+            ini_path.unlink(missing_ok=True)
+            self._configs_cache = None
+            self._path_cache.pop(name, None)
 
             # Remove from metadata
             if name in self.metadata["configurations"]:
@@ -281,6 +329,41 @@ class ConfigurationManager:
 
         return None
 
+    def _fast_copy(self, src: Path, dst: Path) -> None:
+        """
+        Copy a file and its metadata, letting the kernel copy the data where possible.
+
+        On Linux the data is copied with os.copy_file_range, which allows
+        reflinks on copy-on-write filesystems and server-side copies on NFS.
+        Elsewhere, or when the filesystem does not support it, this falls
+        back to shutil.
+
+        Args:
+            src: Source file
+            dst: Destination file
+        """
+        if not hasattr(os, "copy_file_range"):
+            shutil.copy2(src, dst)
+            return
+
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                src_fd = fsrc.fileno()
+                dst_fd = fdst.fileno()
+                remaining = os.fstat(src_fd).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+            # Not supported between these files; copyfile truncates any partial copy
+            shutil.copyfile(src, dst)
+
+        shutil.copystat(src, dst)
+
     def _create_backup_if_exists(self, filepath: Path, suffix: str = ".bak") -> None:
         """
         Create backup of file if it exists.
@@ -289,13 +372,30 @@ class ConfigurationManager:
             filepath: Path to file to backup
             suffix: Backup suffix
         """
-        if filepath.exists():
-            backup_path = filepath.with_suffix(filepath.suffix + suffix)
-            try:
-                shutil.copy2(filepath, backup_path)
-                self.logger.debug(f"Created backup: {backup_path}")
-            except Exception as e:
-                self.logger.warning(f"Failed to create backup for {filepath}: {e}")
+        try:
+            source_stat = filepath.stat()
+        except OSError:
+            return
+
+        backup_path = filepath.with_suffix(filepath.suffix + suffix)
+        try:
+            # Backups carry the source's mtime (copystat), so a matching size and
+            # mtime means the file has not changed since it was last backed up
+            backup_stat = backup_path.stat()
+            if (
+                backup_stat.st_size == source_stat.st_size
+                and backup_stat.st_mtime_ns == source_stat.st_mtime_ns
+            ):
+                self.logger.debug(f"Backup up to date: {backup_path}")
+                return
+        except OSError:
+            pass
+
+        try:
+            self._fast_copy(filepath, backup_path)
+            self.logger.debug(f"Created backup: {backup_path}")
+        except Exception as e:
+            self.logger.warning(f"Failed to create backup for {filepath}: {e}")
 
     def _cleanup_partial_save(self, name: str) -> None:
         """
@@ -305,13 +405,11 @@ class ConfigurationManager:
             name: Configuration name
         """
         try:
-            json_path = self.saved_configs_dir / f"conf_{name}_settings.json"
-            ini_path = self.saved_configs_dir / f"conf_{name}_Config_DX11.ini"
+            json_path, ini_path = self.get_configuration_files(name)
 
-            if json_path.exists():
-                json_path.unlink()
-            if ini_path.exists():
-                ini_path.unlink()
+            json_path.unlink(missing_ok=True)
+            ini_path.unlink(missing_ok=True)
+            self._configs_cache = None
 
         except Exception as e:
             self.logger.error(f"Failed to cleanup partial save for '{name}': {e}")
@@ -326,10 +424,9 @@ class ConfigurationManager:
         Returns:
             True if both files exist
         """
-        json_path = self.saved_configs_dir / f"conf_{name}_settings.json"
-        ini_path = self.saved_configs_dir / f"conf_{name}_Config_DX11.ini"
+        json_path, ini_path = self.get_configuration_files(name)
 
-        return json_path.exists() and ini_path.exists()
+        return json_path.is_file() and ini_path.is_file()
 
     def get_configuration_files(self, name: str) -> Tuple[Path, Path]:
         """
@@ -341,10 +438,15 @@ class ConfigurationManager:
         Returns:
             Tuple of (json_path, ini_path)
         """
-        json_path = self.saved_configs_dir / f"conf_{name}_settings.json"
-        ini_path = self.saved_configs_dir / f"conf_{name}_Config_DX11.ini"
-
-        return json_path, ini_path
+        paths = self._path_cache.get(name)
+        if paths is None:
+            paths = (
+                self.saved_configs_dir / f"conf_{name}_settings.json",
+                self.saved_configs_dir / f"conf_{name}_Config_DX11.ini",
+            )
+            self._path_cache[name] = paths
+
+        return paths
 
     def get_saved_configs_directory(self) -> Path:
         """
@@ -5,6 +5,7 @@ This module provides the main data model for configuration management,
 including loading, modification tracking, and validation.
 """
 
+import sys
 from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Set
@@ -56,12 +57,41 @@ class ConfigurationModel:
         try:
             # Parse JSON configuration
             json_parser = JsonWithCommentsParser()
-            self.json_config = json_parser.parse_file(json_path)
-            self.json_file_path = json_path
+            json_config = json_parser.parse_file(json_path)
 
             # Parse INI configuration
             ini_parser = IniParser()
-            self.ini_config = ini_parser.parse_file(ini_path)
+            ini_config = ini_parser.parse_file(ini_path)
+
+            return self.load_from_parsed(json_config, ini_config, json_path, ini_path)
+
+        except Exception as e:
+            self.logger.error(f"Error loading configuration: {e}")
+            return False
+
+    def load_from_parsed(
+        self,
+        json_config: ConfigData,
+        ini_config: ConfigData,
+        json_path: Path,
+        ini_path: Path,
+    ) -> bool:
+        """
+        Load configuration from already parsed JSON and INI data.
+
+        Args:
+            json_config: Parsed settings.json data
+            ini_config: Parsed Config_DX11.ini data
+            json_path: Path the JSON data was read from and will be written to
+            ini_path: Path the INI data was read from and will be written to
+
+        Returns:
+            True if loading was successful, False otherwise
+        """
+        try:
+            self.json_config = json_config
+            self.json_file_path = json_path
+            self.ini_config = ini_config
             self.ini_file_path = ini_path
 
             # Initialize field states
@@ -93,7 +123,7 @@ class ConfigurationModel:
         if self.ini_config:
             for field_path, field_info in self.ini_config.fields.items():
                 # Prefix INI fields to avoid conflicts
-                ini_field_path = f"ini.{field_path}"
+                ini_field_path = sys.intern(f"ini.{field_path}")
                 self.field_states[ini_field_path] = FieldState(field_info.value)
 
     def get_field_value(self, field_path: str) -> Any:
@@ -303,7 +333,8 @@ class ConfigurationModel:
                     return False, "Failed to write INI configuration"
 
             # Mark all changes as applied
-            for field_path in list(self._modified_fields):
+            applied_fields = list(self._modified_fields)
+            for field_path in applied_fields:
                 field_state = self.field_states.get(field_path)
                 if field_state:
                     field_state.apply_changes()
@@ -311,7 +342,7 @@ class ConfigurationModel:
             self._modified_fields.clear()
 
             self.logger.info("Successfully applied all configuration changes")
-            self._notify_observers("changes_applied")
+            self._notify_observers("changes_applied", applied_fields)
 
             return True, None
 
@@ -340,6 +371,33 @@ class ConfigurationModel:
 
         return None
 
+    def snapshot_fields(self) -> Dict[str, FieldInfo]:
+        """
+        Get field information for all loaded fields in one pass.
+
+        The model keeps each FieldInfo's value in sync with the field's current
+        value, so the result reflects pending modifications.
+
+        Returns:
+            Dictionary mapping field paths (INI fields prefixed with "ini.") to FieldInfo
+        """
+        snapshot = {}
+
+        if self.json_config:
+            for field_path, field_info in self.json_config.fields.items():
+                field_state = self.field_states.get(field_path)
+                if field_state:
+                    snapshot[field_path] = field_info
+
+        if self.ini_config:
+            for field_path, field_info in self.ini_config.fields.items():
+                ini_field_path = f"ini.{field_path}"
+                field_state = self.field_states.get(ini_field_path)
+                if field_state:
+                    snapshot[ini_field_path] = field_info
+
+        return snapshot
+
     def get_categories(self) -> Dict[str, List[str]]:
         """
         Get all categories and their fields.
@@ -6,10 +6,12 @@ Provides efficient search capabilities with pre-built indices and fuzzy matching
 
 import re
 import logging
-from typing import Dict, List, Set, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Set, Optional, Any, Tuple
+from dataclasses import dataclass, field
 from collections import defaultdict
 import time
+import heapq
+from operator import attrgetter
 
 from ..models.configuration_model import ConfigurationModel
 
@@ -25,6 +27,7 @@ class SearchResult:
     relevance_score: float
     matched_text: str
     context: str = ""
+    position: Tuple[int, int] = (999, 999)  # (tab_index, field_index)
 
 
 class TrieNode:
@@ -89,6 +92,58 @@ class SearchTrie:
         # Collect all field paths from this node and its children
         return self._collect_field_paths(node)
 
+    def words_with_prefix(self, prefix: str) -> List[str]:
+        """
+        Get all complete words stored under the given prefix.
+
+        Only the subtree below the prefix is visited, so the cost does not
+        depend on the total number of words in the trie.
+
+        Args:
+            prefix: Lowercase prefix to complete
+
+        Returns:
+            List of words starting with the prefix
+        """
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        words = []
+        stack = [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if node.is_end_of_word:
+                words.append(word)
+            for char, child in node.children.items():
+                stack.append((child, word + char))
+        return words
+
+    def remove(self, word: str, field_path: str) -> None:
+        """
+        Remove a field path association for a word from the trie.
+
+        Args:
+            word: Word to remove
+            field_path: Associated field path
+        """
+        word = word.lower().strip()
+        if not word:
+            return
+
+        node = self.root
+        for char in word:
+            node = node.children.get(char)
+            if node is None:
+                return
+            node.field_paths.discard(field_path)
+
+        if node.word_count > 0:
+            node.word_count -= 1
+            node.is_end_of_word = node.word_count > 0
+
     def _collect_field_paths(self, node: TrieNode) -> Set[str]:
         """Recursively collect all field paths from a node."""
         paths = node.field_paths.copy()
@@ -110,6 +165,7 @@ class SearchIndex:
     category_mapping: Dict[str, str]
     word_to_fields: Dict[str, Set[str]]
     last_updated: float
+    value_words: Dict[str, Set[str]] = field(default_factory=dict)
 
 
 class SearchIndexer:
@@ -133,6 +189,37 @@ class SearchIndexer:
         self.search_cache: Dict[str, List[SearchResult]] = {}
         self.cache_max_size = 50
 
+        # Display order of fields as (tab_index, field_index); when set,
+        # search results are returned in this order instead of by relevance
+        self.field_positions: Dict[str, Tuple[int, int]] = {}
+
+    @property
+    def ordered(self) -> bool:
+        """Check if search results are returned in display order."""
+        return bool(self.field_positions)
+
+    @property
+    def field_count(self) -> int:
+        """Get the number of fields in the current index."""
+        return len(self.index.field_data) if self.index else 0
+
+    def set_field_order(self, positions: Dict[str, Tuple[int, int]]) -> None:
+        """
+        Set the display order used to sort search results.
+
+        Args:
+            positions: Mapping of field paths to (tab_index, field_index)
+        """
+        self.field_positions = positions
+
+        # Stamp positions into the existing index entries
+        if self.index:
+            for field_path, data in self.index.field_data.items():
+                data["position"] = positions.get(field_path, (999, 999))
+
+        # Cached results were ordered with the previous positions
+        self.search_cache.clear()
+
     def build_index(self, config_model: ConfigurationModel) -> SearchIndex:
         """
         Build search index from configuration model.
@@ -152,6 +239,7 @@ class SearchIndexer:
         field_data = {}
         category_mapping = {}
         word_to_fields = defaultdict(set)
+        value_words = {}
 
         # Index all fields
         field_count = 0
@@ -174,6 +262,7 @@ class SearchIndexer:
                 "value": value,
                 "category": category,
                 "type": field_info.type.value if field_info.type else "unknown",
+                "position": self.field_positions.get(field_path, (999, 999)),
             }
 
             category_mapping[field_path] = category
@@ -193,8 +282,9 @@ class SearchIndexer:
 
             # Index value (for searchable values)
             if value and len(value) <= 100:  # Don't index very long values
-                value_words = self._extract_words(value)
-                for word in value_words:
+                field_value_words = set(self._extract_words(value))
+                value_words[field_path] = field_value_words
+                for word in field_value_words:
                     value_trie.insert(word, field_path)
                     word_to_fields[word].add(field_path)
 
@@ -207,6 +297,7 @@ class SearchIndexer:
             category_mapping=category_mapping,
             word_to_fields=dict(word_to_fields),
             last_updated=time.time(),
+            value_words=value_words,
         )
 
         self.index_build_time = time.time() - start_time
@@ -235,6 +326,48 @@ class SearchIndexer:
         self.logger.debug(f"Incremental update requested for {len(changes)} fields")
         # TODO: Implement true incremental updates
 
+    def update_field(self, field_path: str, new_value: Any) -> None:
+        """
+        Re-index the value of a single field.
+
+        Args:
+            field_path: Path of the field whose value changed
+            new_value: New field value
+        """
+        if not self.index or field_path not in self.index.field_data:
+            return
+
+        field_data = self.index.field_data[field_path]
+        value = str(new_value) if new_value is not None else ""
+        if value == field_data["value"]:
+            return
+
+        # Words still contributed by the name and description
+        other_words = set(self._extract_words(field_data["name"]))
+        other_words.update(self._extract_words(field_data["description"]))
+
+        # Remove postings for the old value
+        for word in self.index.value_words.pop(field_path, set()):
+            self.index.value_trie.remove(word, field_path)
+            if word not in other_words:
+                fields = self.index.word_to_fields.get(word)
+                if fields is not None:
+                    fields.discard(field_path)
+                    if not fields:
+                        del self.index.word_to_fields[word]
+
+        # Add postings for the new value
+        field_data["value"] = value
+        if value and len(value) <= 100:  # Don't index very long values
+            new_words = set(self._extract_words(value))
+            self.index.value_words[field_path] = new_words
+            for word in new_words:
+                self.index.value_trie.insert(word, field_path)
+                self.index.word_to_fields.setdefault(word, set()).add(field_path)
+
+        self.index.last_updated = time.time()
+        self.search_cache.clear()
+
     def search_with_index(self, query: str) -> List[SearchResult]:
         """
         Search using the built index.
@@ -302,6 +435,10 @@ class SearchIndexer:
         # Limit results
         results = results[: self.max_results]
 
+        # Present the most relevant results in display order
+        if self.field_positions:
+            results.sort(key=attrgetter("position"))
+
         # Cache results
         if len(self.search_cache) >= self.cache_max_size:
             # Remove oldest entry
@@ -404,6 +541,7 @@ class SearchIndexer:
             relevance_score=relevance_score,
             matched_text=matched_text,
             context=context,
+            position=field_data.get("position", (999, 999)),
         )
 
     def get_search_suggestions(self, partial_query: str, limit: int = 10) -> List[str]:
@@ -420,27 +558,22 @@ class SearchIndexer:
         if not self.index or len(partial_query) < 2:
             return []
 
-        suggestions = set()
-
-        # Get suggestions from word mappings
-        partial_lower = partial_query.lower()
-        for word in self.index.word_to_fields.keys():
-            if word.startswith(partial_lower):
-                suggestions.add(word)
-            if len(suggestions) >= limit * 2:  # Get more than needed for filtering
-                break
-
-        # Sort by relevance (frequency in this case)
-        scored_suggestions = []
-        for suggestion in suggestions:
-            if suggestion in self.index.word_to_fields:
-                field_count = len(self.index.word_to_fields[suggestion])
-                scored_suggestions.append((suggestion, field_count))
-
-        # Sort by field count (more popular terms first)
-        scored_suggestions.sort(key=lambda x: x[1], reverse=True)
-
-        return [suggestion for suggestion, _ in scored_suggestions[:limit]]
+        # Complete the prefix from the tries instead of scanning every word;
+        # together they hold the same words as word_to_fields
+        partial_lower = partial_query.lower().strip()
+        suggestions = set(self.index.name_trie.words_with_prefix(partial_lower))
+        suggestions.update(self.index.description_trie.words_with_prefix(partial_lower))
+        suggestions.update(self.index.value_trie.words_with_prefix(partial_lower))
+
+        # Sort by relevance (frequency in this case), more popular terms first
+        word_to_fields = self.index.word_to_fields
+        scored_suggestions = [
+            (len(word_to_fields[suggestion]), suggestion)
+            for suggestion in suggestions
+            if suggestion in word_to_fields
+        ]
+
+        return [suggestion for _, suggestion in heapq.nlargest(limit, scored_suggestions)]
 
     def get_index_stats(self) -> Dict[str, Any]:
         """
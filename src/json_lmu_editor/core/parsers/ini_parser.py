@@ -5,6 +5,7 @@ Handles parsing of INI files while preserving comments and structure.
 """
 
 import re
+import sys
 from collections import OrderedDict
 from pathlib import Path
 from typing import Any, List
@@ -180,8 +181,10 @@ class IniParser:
         fields = OrderedDict()
 
         for section_name, section_data in parsed_data.items():
+            # Shared with every other configuration that has this section
+            section_name = sys.intern(section_name)
             for key, value_info in section_data.items():
-                field_path = f"{section_name}.{key}"
+                field_path = sys.intern(f"{section_name}.{key}")
                 value = value_info["value"]
                 comment = value_info.get("comment", "")
 
@@ -6,6 +6,7 @@ Handles parsing of JSON files with embedded comments and field descriptions.
 
 import json
 import re
+import sys
 from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
@@ -264,7 +265,8 @@ class JsonWithCommentsParser:
         fields = OrderedDict()
 
         for key, value in data.items():
-            current_path = f"{parent_path}.{key}" if parent_path else key
+            # Interned so every path-keyed dict shares one string object
+            current_path = sys.intern(f"{parent_path}.{key}" if parent_path else key)
             field_type = self.preserve_types(value)
             # Try to find description by field name (key) first, then by full path
             # This handles both inline comments and standalone description fields
@@ -274,7 +276,7 @@ class JsonWithCommentsParser:
 
             if isinstance(value, dict):
                 # This is a category/section
-                category = key
+                category = sys.intern(key)
                 # Recursively process nested fields
                 nested_fields = self.build_field_hierarchy(
                     value, descriptions, current_path
@@ -12,6 +12,9 @@ from pathlib import Path
 from typing import Dict, Optional, List, Tuple
 import logging
 
+from .parsers.json_parser import ConfigData, JsonWithCommentsParser
+from .parsers.ini_parser import IniParser
+
 
 class ProfileMetadata:
     """Metadata for a profile."""
@@ -55,6 +58,14 @@ class ProfileManager:
         # Active profile tracking file
         self.active_profile_file = self.profiles_dir / "active_profile.json"
         
+        # Cached profile names, rescanned only after profiles are created or deleted
+        self._cached_list: List[str] = []
+        self._list_dirty = True
+        
+        # Cached active profile name, kept in sync by set/clear_active_profile
+        self._active_profile: Optional[str] = None
+        self._active_profile_loaded = False
+        
         self.logger.info(f"Profile manager initialized with directory: {self.profiles_dir}")
     
     def _get_profiles_dir(self) -> Path:
@@ -77,11 +88,14 @@ class ProfileManager:
     
     def list_profiles(self) -> List[str]:
         """List all available profiles."""
-        profiles = []
-        for item in self.profiles_dir.iterdir():
-            if item.is_dir() and (item / "metadata.json").exists():
-                profiles.append(item.name)
-        return sorted(profiles)
+        if self._list_dirty:
+            profiles = []
+            for item in self.profiles_dir.iterdir():
+                if item.is_dir() and (item / "metadata.json").exists():
+                    profiles.append(item.name)
+            self._cached_list = sorted(profiles)
+            self._list_dirty = False
+        return list(self._cached_list)
     
     def get_profile_metadata(self, profile_name: str) -> Optional[ProfileMetadata]:
         """Get metadata for a profile."""
@@ -116,6 +130,7 @@ class ProfileManager:
             # Create profile directory
             profile_dir = self.profiles_dir / profile_name
             profile_dir.mkdir(exist_ok=True)
+            self._list_dirty = True
             
             # Copy files
             if json_file.exists():
@@ -161,13 +176,35 @@ class ProfileManager:
             if ini_file.exists():
                 shutil.copy2(ini_file, profile_dir / "Config_DX11.ini")
             
-            # Update metadata
-            metadata = self.get_profile_metadata(profile_name)
-            if metadata:
-                metadata.last_modified = datetime.now()
-                metadata_file = profile_dir / "metadata.json"
-                with open(metadata_file, 'w', encoding='utf-8') as f:
-                    json.dump(metadata.to_dict(), f, indent=2)
+            self._touch_metadata(profile_name)
+            
+            self.logger.info(f"Profile '{profile_name}' updated successfully")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to update profile '{profile_name}': {e}")
+            return False
+    
+    def update_profile_from_contents(self, profile_name: str, contents: Dict[str, bytes]) -> bool:
+        """
+        Update an existing profile with settings file contents already in memory.
+        
+        Args:
+            profile_name: Name of the profile
+            contents: Mapping of profile file names to file contents
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            profile_dir = self.profiles_dir / profile_name
+            if not profile_dir.exists():
+                return False
+            
+            for file_name, data in contents.items():
+                (profile_dir / file_name).write_bytes(data)
+            
+            self._touch_metadata(profile_name)
             
             self.logger.info(f"Profile '{profile_name}' updated successfully")
             return True
@@ -176,6 +213,15 @@ class ProfileManager:
             self.logger.error(f"Failed to update profile '{profile_name}': {e}")
             return False
     
+    def _touch_metadata(self, profile_name: str) -> None:
+        """Update the last modified time in a profile's metadata."""
+        metadata = self.get_profile_metadata(profile_name)
+        if metadata:
+            metadata.last_modified = datetime.now()
+            metadata_file = self.profiles_dir / profile_name / "metadata.json"
+            with open(metadata_file, 'w', encoding='utf-8') as f:
+                json.dump(metadata.to_dict(), f, indent=2)
+    
     def load_profile(self, profile_name: str, json_file: Path, ini_file: Path) -> bool:
         """
         Load a profile to the game settings files.
@@ -212,6 +258,75 @@ class ProfileManager:
             self.logger.error(f"Failed to load profile '{profile_name}': {e}")
             return False
     
+    def read_profile(
+        self, profile_name: str, json_file: Path, ini_file: Path
+    ) -> Optional[Tuple[Dict[Path, bytes], ConfigData, ConfigData]]:
+        """
+        Read and parse a profile's settings files without changing the game files.
+        
+        The profile files are parsed directly, so loading the profile with
+        apply_profile_contents needs no second parse of the game files. Only
+        new parser instances are used, so this is safe to call off the UI thread.
+        
+        Args:
+            profile_name: Name of the profile
+            json_file: Target path for settings.json
+            ini_file: Target path for Config_DX11.ini
+            
+        Returns:
+            Tuple of (game file path to new contents, json_config, ini_config)
+            or None if reading failed
+        """
+        try:
+            profile_dir = self.profiles_dir / profile_name
+            if not profile_dir.exists():
+                return None
+            
+            # A file missing from the profile leaves the game file in place,
+            # as load_profile does, so the game file is what gets parsed
+            contents: Dict[Path, bytes] = {}
+            sources = []
+            for file_name, target in (("settings.json", json_file), ("Config_DX11.ini", ini_file)):
+                profile_file = profile_dir / file_name
+                if profile_file.exists():
+                    contents[target] = profile_file.read_bytes()
+                    sources.append(profile_file)
+                else:
+                    sources.append(target)
+            
+            json_config = JsonWithCommentsParser().parse_file(sources[0])
+            ini_config = IniParser().parse_file(sources[1])
+            return contents, json_config, ini_config
+            
+        except Exception as e:
+            self.logger.error(f"Failed to read profile '{profile_name}': {e}")
+            return None
+    
+    def apply_profile_contents(self, profile_name: str, contents: Dict[Path, bytes]) -> bool:
+        """
+        Write profile contents from read_profile to the game files and activate the profile.
+        
+        Args:
+            profile_name: Name of the profile
+            contents: Mapping of game file paths to the profile's file contents
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            for target, data in contents.items():
+                target.write_bytes(data)
+            
+            # Set as active profile
+            self.set_active_profile(profile_name)
+            
+            self.logger.info(f"Profile '{profile_name}' loaded successfully")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to load profile '{profile_name}': {e}")
+            return False
+    
     def delete_profile(self, profile_name: str) -> bool:
         """
         Delete a profile.
@@ -225,6 +340,7 @@ class ProfileManager:
         try:
             profile_dir = self.profiles_dir / profile_name
             if profile_dir.exists():
+                self._list_dirty = True
                 shutil.rmtree(profile_dir)
                 
                 # Clear active profile if it was the deleted one
@@ -249,6 +365,9 @@ class ProfileManager:
             
             with open(self.active_profile_file, 'w', encoding='utf-8') as f:
                 json.dump(active_data, f, indent=2)
+            
+            self._active_profile = profile_name
+            self._active_profile_loaded = True
                 
             self.logger.info(f"Active profile set to '{profile_name}'")
             
@@ -257,13 +376,19 @@ class ProfileManager:
     
     def get_active_profile(self) -> Optional[str]:
         """Get the name of the active profile."""
+        if self._active_profile_loaded:
+            return self._active_profile
+        
         try:
             if not self.active_profile_file.exists():
-                return None
-                
-            with open(self.active_profile_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get("profile_name")
+                self._active_profile = None
+            else:
+                with open(self.active_profile_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    self._active_profile = data.get("profile_name")
+            
+            self._active_profile_loaded = True
+            return self._active_profile
                 
         except Exception as e:
             self.logger.error(f"Failed to get active profile: {e}")
@@ -274,6 +399,8 @@ class ProfileManager:
         try:
             if self.active_profile_file.exists():
                 self.active_profile_file.unlink()
+            self._active_profile = None
+            self._active_profile_loaded = True
             self.logger.info("Active profile cleared")
         except Exception as e:
             self.logger.error(f"Failed to clear active profile: {e}")
@@ -289,42 +416,59 @@ class ProfileManager:
         Returns:
             Tuple of (files_match, active_profile_name, differences)
         """
+        files_match, active_profile, differences, _ = self.sync_with_active_profile(
+            json_file, ini_file
+        )
+        return files_match, active_profile, differences
+    
+    def sync_with_active_profile(
+        self, json_file: Path, ini_file: Path
+    ) -> Tuple[bool, Optional[str], List[str], Dict[str, bytes]]:
+        """
+        Compare current settings with active profile, reading each file once.
+        
+        The current file contents are returned so that the profile can be
+        updated with update_profile_from_contents without reading them again.
+        
+        Args:
+            json_file: Current settings.json file
+            ini_file: Current Config_DX11.ini file
+            
+        Returns:
+            Tuple of (files_match, active_profile_name, differences, current_contents)
+        """
         active_profile = self.get_active_profile()
         if not active_profile:
-            return True, None, []
+            return True, None, [], {}
         
         profile_dir = self.profiles_dir / active_profile
         if not profile_dir.exists():
-            return True, active_profile, []
+            return True, active_profile, [], {}
         
         differences = []
+        contents = {}
         
-        # Compare JSON file
-        profile_json = profile_dir / "settings.json"
-        if profile_json.exists() and json_file.exists():
-            if not self._files_identical(json_file, profile_json):
-                differences.append("settings.json")
-        elif profile_json.exists() != json_file.exists():
-            differences.append("settings.json (missing)")
-        
-        # Compare INI file
-        profile_ini = profile_dir / "Config_DX11.ini"
-        if profile_ini.exists() and ini_file.exists():
-            if not self._files_identical(ini_file, profile_ini):
-                differences.append("Config_DX11.ini")
-        elif profile_ini.exists() != ini_file.exists():
-            differences.append("Config_DX11.ini (missing)")
+        for file_name, current_file in (("settings.json", json_file), ("Config_DX11.ini", ini_file)):
+            profile_file = profile_dir / file_name
+            current_data = None
+            if current_file.exists():
+                try:
+                    current_data = current_file.read_bytes()
+                    contents[file_name] = current_data
+                except Exception as e:
+                    self.logger.warning(f"Failed to read {current_file}: {e}")
+            
+            if profile_file.exists() and current_file.exists():
+                try:
+                    if current_data is None or current_data != profile_file.read_bytes():
+                        differences.append(file_name)
+                except Exception:
+                    differences.append(file_name)
+            elif profile_file.exists() != current_file.exists():
+                differences.append(f"{file_name} (missing)")
         
         files_match = len(differences) == 0
-        return files_match, active_profile, differences
-    
-    def _files_identical(self, file1: Path, file2: Path) -> bool:
-        """Check if two files have identical content."""
-        try:
-            with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
-                return f1.read() == f2.read()
-        except Exception:
-            return False
+        return files_match, active_profile, differences, contents
     
     def get_profile_files(self, profile_name: str) -> Tuple[Optional[Path], Optional[Path]]:
         """
@@ -5,8 +5,9 @@ Provides the main application window with tabbed interface, search, and configur
 """
 
 import sys
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Callable, Optional, List, Dict, Tuple
 import logging
 
 from PyQt6.QtWidgets import (
@@ -22,10 +23,22 @@ from PyQt6.QtWidgets import (
     QDialog,
     QSizePolicy, # Added for setting panel policies
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QSettings, QUrl
-from PyQt6.QtGui import QAction, QKeySequence, QDesktopServices, QResizeEvent
+from PyQt6.QtCore import (
+    Qt,
+    QTimer,
+    pyqtSignal,
+    QSettings,
+    QUrl,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QByteArray,
+)
+from PyQt6.QtGui import QAction, QKeySequence, QDesktopServices, QResizeEvent, QMoveEvent
 
 from ..core.models.configuration_model import ConfigurationModel
+from ..core.parsers.json_parser import JsonWithCommentsParser
+from ..core.parsers.ini_parser import IniParser
 from ..core.game_detector import GameDetector
 from ..core.configuration_manager import ConfigurationManager
 from ..core.comparison_engine import ComparisonEngine
@@ -35,17 +48,47 @@ from .widgets.search_widget import SearchWidget
 from .widgets.category_tabs import CategoryTabWidget
 from .widgets.config_panel import ConfigurationPanel
 from .widgets.apply_button import ApplyChangesButton
-from .dialogs.save_dialog import SaveConfigurationDialog
-from .dialogs.compare_dialog import ComparisonDialog
 from .shortcuts.shortcut_manager import ShortcutManager
 from ..core.error_handler import ErrorHandler, ErrorContext
 from .dialogs.error_dialog import ErrorDialog
-from .dialogs.startup_info_dialog import StartupInfoDialog # Added import
-from .dialogs.profile_sync_dialog import ProfileSyncDialog, ProfileSyncChoice
 from ..core.optimizations.search_indexer import SearchIndexer
 from ..core.optimizations.lazy_loader import LazyLoader
 from ..core.profile_manager import ProfileManager
 
+# Separators replaced by spaces when converting category names to PascalCase
+_PASCAL_TRANS = str.maketrans({"_": " ", "-": " "})
+
+
+class _TaskSignals(QObject):
+    """Signals used by background tasks to report back to the UI thread."""
+
+    finished = pyqtSignal(object)  # result of the task
+    failed = pyqtSignal(str)  # error message
+
+
+class _ParseTask(QRunnable):
+    """Runs file copy/parse work on the global thread pool."""
+
+    def __init__(self, work: Callable[[], Any]):
+        """
+        Initialize the task.
+
+        Args:
+            work: Callable performing the I/O; its return value is emitted on success
+        """
+        super().__init__()
+        self.work = work
+        self.signals = _TaskSignals()
+
+    def run(self) -> None:
+        """Run the work and emit its result or error."""
+        try:
+            result = self.work()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -77,7 +120,10 @@ class MainWindow(QMainWindow):
 
         # UI components
         self.central_widget: Optional[QWidget] = None
+        self.splitter: Optional[QSplitter] = None
         self.search_widget: Optional[SearchWidget] = None
+        # Direct reference to the config panel's search widget
+        self._search_widget: Optional[SearchWidget] = None
         self.category_tabs: Optional[CategoryTabWidget] = None
         self.config_panel: Optional[ConfigurationPanel] = None
         self.apply_button: Optional[ApplyChangesButton] = None
@@ -85,6 +131,12 @@ class MainWindow(QMainWindow):
 
         # Shortcut manager
         self.shortcut_manager: Optional[ShortcutManager] = None
+        # Generated help HTML, rebuilt only when shortcut bindings change
+        self._shortcuts_html_cache: Optional[str] = None
+        # Help and about dialogs, created on first open and reused
+        self._shortcuts_dialog: Optional[QDialog] = None
+        self._shortcuts_help_text: Optional[QLabel] = None
+        self._about_box: Optional[QMessageBox] = None
 
         # Error handler
         self.error_handler = ErrorHandler()
@@ -93,13 +145,60 @@ class MainWindow(QMainWindow):
         self.search_indexer = SearchIndexer()
         self.lazy_loader = LazyLoader()
 
+        # Background I/O tasks in flight (None when idle)
+        self._compare_task: Optional[_ParseTask] = None
+        self._profile_load_task: Optional[_ParseTask] = None
+
+        # Snapshot of config_model.get_categories() for the loaded configuration
+        self._categories_cache: Optional[Dict[str, List[str]]] = None
+
+        # Tab name -> field list mapping used to order search results.
+        # Built lazily and invalidated whenever the categories are repopulated.
+        self._tab_name_to_fields: Optional[Dict[str, List[str]]] = None
+        # Tab names in display order, captured once per tab population
+        self._tab_names: List[str] = []
+        # field_path -> (tab_index, field_index) built once per tab population
+        self._field_position_index: Dict[str, Tuple[int, int]] = {}
+
+        # Recent search results keyed by normalized query (LRU)
+        self._search_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._search_cache_max_size = 64
+
+        # Set once both panels have been added to the splitter
+        self._splitter_ready = False
+
+        # Coalesce resize events into a single splitter adjustment
+        self._splitter_resize_timer = QTimer(self)
+        self._splitter_resize_timer.setSingleShot(True)
+        self._splitter_resize_timer.setInterval(50)
+        self._splitter_resize_timer.timeout.connect(self._adjust_splitter_sizes)
+
+        # Change count last shown on the apply button (-1 forces a refresh)
+        self._last_apply_count: int = -1
+
+        # Model event name -> handler, looked up on every model notification
+        self._model_event_handlers: Dict[str, Callable[..., None]] = {
+            "field_changed": self._on_field_changed,
+            "field_reverted": self._on_field_reverted,
+            "all_changes_reverted": self._on_all_changes_reverted,
+            "changes_applied": self._on_changes_applied,
+        }
+
         # Settings
         self.qt_settings = QSettings("LMUConfigEditor", "MainWindow")
+        # Last geometry/state written to (or read from) settings
+        self._last_saved_geometry: Optional[QByteArray] = None
+        self._last_saved_state: Optional[QByteArray] = None
+        # Set when the user moves or resizes the window
+        self._geometry_dirty = False
 
         # Active configuration tracking
         self.current_loaded_config_name: Optional[str] = None
         self.current_loaded_config_is_profile: bool = False
 
+        # Active profile and file mtimes recorded when the files last matched it
+        self._last_sync_check: Optional[Tuple] = None
+
         # Initialize UI
         self.setup_ui()
         self.setup_connections()
@@ -287,6 +386,7 @@ class MainWindow(QMainWindow):
             apply_button_widget=self.apply_button,
             search_indexer=self.search_indexer
         )
+        self._search_widget = self.config_panel.search_widget
         sp_panel = self.config_panel.sizePolicy()
         sp_panel.setHorizontalPolicy(QSizePolicy.Policy.Expanding)
         sp_panel.setVerticalPolicy(QSizePolicy.Policy.Expanding)
@@ -312,6 +412,7 @@ class MainWindow(QMainWindow):
 
         self.splitter.setCollapsible(0, False)  # Don't allow collapsing tabs
         self.splitter.setCollapsible(1, False)  # Don't allow collapsing config panel
+        self._splitter_ready = self.splitter.count() == 2
         
         # Ensure the handle remains non-movable by the user if that's the intent
         # This needs to be done AFTER widgets are added.
@@ -636,12 +737,34 @@ class MainWindow(QMainWindow):
             self.logger.warning("populate_categories: category_tabs or config_model is None. Skipping.")
             return
         
+        self._categories_cache = None
+        self._tab_name_to_fields = None
+        self._tab_names = []
+        self._field_position_index = {}
+        self._search_cache.clear()
+
         self.logger.info("populate_categories: Fetching categories from model...")
-        categories = self.config_model.get_categories()
+        categories = self._categories()
         self.logger.info(f"populate_categories: Fetched {len(categories) if categories else 'no'} categories. Populating tabs...")
         self.category_tabs.populate_categories(categories, self.config_model)
+        self._tab_names = [
+            self.category_tabs.tabText(i) for i in range(self.category_tabs.count())
+        ]
+        self._build_field_position_index()
+        self.search_indexer.set_field_order(self._field_position_index)
         self.logger.info("populate_categories: Tabs populated.")
     
+    def _categories(self) -> Dict[str, List[str]]:
+        """
+        Get the categories of the loaded configuration, cached per load.
+
+        Returns:
+            Dictionary mapping category names to field lists
+        """
+        if self._categories_cache is None:
+            self._categories_cache = self.config_model.get_categories()
+        return self._categories_cache
+
     def browse_for_game(self) -> None:
         """Browse for game installation folder."""
         folder = QFileDialog.getExistingDirectory(
@@ -701,22 +824,47 @@ class MainWindow(QMainWindow):
         if not self.config_model:
             return
 
-        # Use search indexer for better performance
-        if self.search_indexer.index:
-            search_results = self.search_indexer.search_with_index(query)
-            results = [result.field_path for result in search_results]
-            # Sort results by tab order and field order within tabs
-            results = self._sort_results_by_tab_order(results)
+        # An empty query matches nothing; clear without touching the index
+        # (SearchWidget already holds back queries shorter than two characters)
+        cache_key = query.strip().lower()
+        if not cache_key:
+            if self.category_tabs:
+                self.category_tabs.clear_search_results()
+            search_widget = self._search_widget
+            if search_widget:
+                search_widget.update_search_results([])
+            return
+
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            self._search_cache.move_to_end(cache_key)
+            # Copy so consumers that clear their result list don't empty the cache
+            results = list(cached)
         else:
-            # Fallback to model search
-            results = self.config_model.search_fields(query)
-            results = self._sort_results_by_tab_order(results)
+            # Use search indexer for better performance
+            if self.search_indexer.index:
+                search_results = self.search_indexer.search_with_index(query)
+                results = [result.field_path for result in search_results]
+                # Sort results by tab order and field order within tabs,
+                # unless the indexer already returned them in that order
+                if not self.search_indexer.ordered:
+                    results = self._sort_results_by_tab_order(results)
+            else:
+                # Fallback to model search
+                results = self.config_model.search_fields(query)
+                results = self._sort_results_by_tab_order(results)
+
+            self._search_cache[cache_key] = list(results)
+            if len(self._search_cache) > self._search_cache_max_size:
+                self._search_cache.popitem(last=False)
 
+        # Navigation only moves indices, so the tabs' highlighted fields and the
+        # widget's results must both be updated from the same list here
         if self.category_tabs:
             self.category_tabs.highlight_search_results(results)
 
         # Update search widget with results
-        search_widget = self.config_panel.search_widget if self.config_panel else None
+        search_widget = self._search_widget
         if search_widget:
             search_widget.update_search_results(results)
             # Sync navigation position with category tabs
@@ -729,7 +877,15 @@ class MainWindow(QMainWindow):
         self.logger.info(f"Search: {len(results)} results for '{query}'")  # Log instead
 
     def on_search_performed(self, query: str) -> None:
-        """Handle search performed from search widget."""
+        """
+        Handle search performed from search widget.
+
+        The widget debounces typing before emitting, so the search runs right
+        away; pressing Enter emits without waiting for the debounce.
+
+        Args:
+            query: Search query
+        """
         self.perform_search(query)
 
     def on_search_navigation(self, direction: int) -> None:
@@ -747,17 +903,12 @@ class MainWindow(QMainWindow):
         else:
             success = self.category_tabs.navigate_to_previous_result()
 
-        search_widget = self.config_panel.search_widget if self.config_panel else None
+        search_widget = self._search_widget
         if success and search_widget:
             # Update search widget with current position
             current, total = self.category_tabs.get_current_search_position()
             if total > 0:
-                search_widget.current_index = current - 1
-                search_widget.current_results = (
-                    self.category_tabs.highlighted_fields
-                )
-                search_widget.update_result_counter()
-                search_widget.update_navigation_buttons(True)
+                search_widget.set_position(current - 1)
 
     def clear_search(self) -> None:
         """Clear search results."""
@@ -776,76 +927,81 @@ class MainWindow(QMainWindow):
         Returns:
             Sorted list of field paths
         """
+        # Nothing to order for zero or one result
+        if len(results) <= 1:
+            return list(results)
+
         if not self.category_tabs or not self.config_model:
             return results
 
-        # Get all categories with their field lists in original order
-        categories = self.config_model.get_categories()
-
-        # Create a mapping of field_path to (tab_index, field_index_in_tab)
-        field_order_map = {}
-
-        # Get tab order and map to original category names
-        for tab_index in range(self.category_tabs.count()):
-            tab_name = self.category_tabs.tabText(tab_index)
-
-            # Find matching category in the configuration model
-            category_field_list = None
-
-            # Special handling for DX11 tab
-            if tab_name == "Config_DX11.ini":
-                # Collect all DX11 fields
-                dx11_fields = []
-                for category_name, field_list in categories.items():
-                    if "DX11" in category_name:
-                        dx11_fields.extend(field_list)
-                category_field_list = dx11_fields
-            elif tab_name == "Misc":
-                # Collect all fields from categories with less than 8 fields
-                misc_fields = []
-                for category_name, field_list in categories.items():
-                    if "DX11" not in category_name and len(field_list) < 9:
-                        misc_fields.extend(field_list)
-                category_field_list = misc_fields
-            else:
-                # Handle JSON categories
-                for category_name, field_list in categories.items():
-                    if "DX11" not in category_name:  # Skip DX11 categories
-                        # Extract original category name from the full category name
-                        original_category = category_name
-                        if original_category.startswith("JSON - "):
-                            original_category = original_category[7:]
-
-                        # Convert to PascalCase for comparison
-                        pascal_category = "".join(
-                            word.capitalize()
-                            for word in original_category.replace("_", " ")
-                            .replace("-", " ")
-                            .split()
-                        )
+        if not self._field_position_index:
+            self._build_field_position_index()
+
+        position_index = self._field_position_index
+        return sorted(
+            results, key=lambda field_path: position_index.get(field_path, (999, 999))
+        )  # Put unmapped fields at end
+
+    def _build_field_position_index(self) -> None:
+        """Map every field path to its (tab_index, field_index) position."""
+        self._field_position_index = {}
+        if not self.category_tabs or not self.config_model:
+            return
+
+        if self._tab_name_to_fields is None:
+            self._tab_name_to_fields = self._build_tab_name_to_fields()
 
-                        # Match with tab name
-                        if tab_name == pascal_category:
-                            category_field_list = field_list
-                            break
+        for tab_index, tab_name in enumerate(self._tab_names):
+            category_field_list = self._tab_name_to_fields.get(tab_name)
 
             if category_field_list:
                 # Map each field in this category to its position
                 for field_index, field_path in enumerate(category_field_list):
-                    if field_path in results:
-                        field_order_map[field_path] = (tab_index, field_index)
+                    self._field_position_index[field_path] = (tab_index, field_index)
+
+    def _build_tab_name_to_fields(self) -> Dict[str, List[str]]:
+        """
+        Build a mapping of tab names to their field lists in display order.
+
+        Returns:
+            Dictionary mapping tab names to field path lists
+        """
+        categories = self._categories()
+        mapping: Dict[str, List[str]] = {}
+        dx11_fields: List[str] = []
+        misc_fields: List[str] = []
+
+        for category_name, field_list in categories.items():
+            if "DX11" in category_name:
+                dx11_fields.extend(field_list)
+                continue
+
+            # Collect all fields from categories with less than 9 fields
+            if len(field_list) < 9:
+                misc_fields.extend(field_list)
+
+            # Extract original category name from the full category name
+            original_category = category_name
+            if original_category.startswith("JSON - "):
+                original_category = original_category[7:]
+
+            # Convert to PascalCase to match the tab name
+            pascal_category = "".join(
+                word.capitalize()
+                for word in original_category.translate(_PASCAL_TRANS).split()
+            )
+            # Keep the first matching category, as the per-tab scan did
+            mapping.setdefault(pascal_category, field_list)
 
-        # Sort results using the order mapping
-        def sort_key(field_path):
-            return field_order_map.get(
-                field_path, (999, 999)
-            )  # Put unmapped fields at end
+        # Special tabs override JSON categories with the same name
+        mapping["Config_DX11.ini"] = dx11_fields
+        mapping["Misc"] = misc_fields
 
-        return sorted(results, key=sort_key)
+        return mapping
 
     def apply_changes(self) -> None:
         """Apply all pending changes."""
-        if not self.config_model.has_changes:
+        if not self.config_model.has_changes or self._profile_load_task is not None:
             return
 
         try:
@@ -853,7 +1009,10 @@ class MainWindow(QMainWindow):
             success, error_msg = self.config_model.apply_changes()
 
             if success:
+                self._categories_cache = None
                 self.apply_button.set_success_state()
+                # The button is showing a temporary state; restyle on next update
+                self._last_apply_count = -1
                 # self.status_label.setText("Changes applied successfully") # REMOVED status_label
                 self.logger.info("Changes applied successfully")  # Log instead
                 self.changes_applied.emit()
@@ -865,6 +1024,7 @@ class MainWindow(QMainWindow):
                 QTimer.singleShot(2000, self.update_apply_button)
             else:
                 self.apply_button.set_error_state(error_msg or "Unknown error")
+                self._last_apply_count = -1
 
                 # Use error handler for apply failures
                 context = ErrorContext(
@@ -884,6 +1044,7 @@ class MainWindow(QMainWindow):
 
         except Exception as e:
             self.apply_button.set_error_state(f"Error: {e}")
+            self._last_apply_count = -1
 
             # Use error handler for exceptions
             context = ErrorContext(
@@ -912,6 +1073,7 @@ class MainWindow(QMainWindow):
 
         if reply == QMessageBox.StandardButton.Yes:
             reverted_count = self.config_model.revert_all_changes()
+            self._categories_cache = None
             # self.status_label.setText(f"Reverted {reverted_count} changes") # REMOVED status_label
             self.logger.info(f"Reverted {reverted_count} changes")  # Log instead
 
@@ -941,6 +1103,8 @@ class MainWindow(QMainWindow):
             existing_configs = self.profile_manager.list_profiles()
 
             # Show save dialog
+            from .dialogs.save_dialog import SaveConfigurationDialog
+
             dialog = SaveConfigurationDialog(existing_configs, self)
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 config_name = dialog.get_configuration_name()
@@ -989,6 +1153,9 @@ class MainWindow(QMainWindow):
         Args:
             config_name: Name of profile to load
         """
+        if self._profile_load_task is not None:
+            self.logger.info("Profile load already in progress")
+            return
 
         # Check for unsaved changes
         if self.config_model.has_changes:
@@ -1013,19 +1180,121 @@ class MainWindow(QMainWindow):
                     "No game configuration is currently loaded. Please load a game first."
                 )
                 return
-                
+
             json_file = self.config_model.json_file_path
             ini_file = self.config_model.ini_file_path
-            
-            success = self.profile_manager.load_profile(config_name, json_file, ini_file)
+            profile_manager = self.profile_manager
 
-            if success:
-                # Reload the configuration model with updated files
-                if self.config_model.load_configuration(json_file, ini_file):
+            def read_profile_files():
+                return config_name, profile_manager.read_profile(
+                    config_name, json_file, ini_file
+                )
+
+            # Read and parse the profile files off the UI thread; the game files
+            # are only written once the result is back on the UI thread
+            self._profile_load_task = self._start_background_task(
+                read_profile_files,
+                self._on_profile_files_loaded,
+                self._on_profile_load_failed,
+            )
+            self._set_profile_load_busy(True)
+
+        except Exception as e:
+            QMessageBox.critical(
+                self, "Load Error", f"Error loading configuration:\n\n{str(e)}"
+            )
+
+    def _start_background_task(
+        self,
+        work: Callable[[], Any],
+        on_finished: Callable[[Any], None],
+        on_failed: Callable[[str], None],
+    ) -> _ParseTask:
+        """
+        Run work on the global thread pool and report back on the UI thread.
+
+        Args:
+            work: Callable performing the I/O
+            on_finished: Slot receiving the work's return value
+            on_failed: Slot receiving the error message
+
+        Returns:
+            The started task
+        """
+        task = _ParseTask(work)
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(on_failed)
+        QThreadPool.globalInstance().start(task)
+        return task
+
+    def _on_profile_load_failed(self, error_message: str) -> None:
+        """
+        Handle a failed background profile load.
+
+        Args:
+            error_message: Error raised by the background task
+        """
+        self._profile_load_task = None
+        self._set_profile_load_busy(False)
+        QMessageBox.critical(
+            self, "Load Error", f"Error loading configuration:\n\n{error_message}"
+        )
+
+    def _set_profile_load_busy(self, busy: bool) -> None:
+        """
+        Block edits and file-writing actions while a profile is loading.
+
+        The loaded profile replaces the model, so edits made meanwhile would be
+        lost, and applying or syncing would write the game files concurrently.
+
+        Args:
+            busy: True when a profile load starts, False when it ends
+        """
+        enabled = not busy
+        if self.category_tabs:
+            self.category_tabs.setEnabled(enabled)
+        if self.config_panel:
+            self.config_panel.set_actions_enabled(enabled)
+        if self.apply_button:
+            if busy:
+                self.apply_button.setEnabled(False)
+            else:
+                # Force update_apply_button to restore the button's state
+                self._last_apply_count = -1
+                self.update_apply_button()
+
+    def _on_profile_files_loaded(self, result: Tuple[str, Optional[Tuple]]) -> None:
+        """
+        Write the profile to the game files and reload the model from its parsed data.
+
+        Args:
+            result: Tuple of (profile name, (contents, json_config, ini_config) or None)
+        """
+        self._profile_load_task = None
+        self._set_profile_load_busy(False)
+        config_name, parsed = result
+
+        try:
+            json_file = self.config_model.json_file_path
+            ini_file = self.config_model.ini_file_path
+
+            if parsed and self.profile_manager.apply_profile_contents(
+                config_name, parsed[0]
+            ):
+                self._categories_cache = None
+                _, json_config, ini_config = parsed
+                # Reload the configuration model from the already parsed profile
+                if self.config_model.load_from_parsed(
+                    json_config, ini_config, json_file, ini_file
+                ):
                     # Update UI
                     self.populate_categories()
                     self.update_apply_button()
 
+                    # Search the loaded profile, not the previous configuration
+                    self.search_indexer.build_index(self.config_model)
+                    self._search_cache.clear()
+
                     self.logger.info(f"Loaded profile: {config_name}")
 
                     # Update configuration panel
@@ -1083,29 +1352,61 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-            # Load selected configuration data
-            from ..core.parsers.json_parser import JsonWithCommentsParser
-            from ..core.parsers.ini_parser import IniParser
+            if self._compare_task is not None:
+                self.logger.info("Comparison already in progress")
+                return
+            if self._profile_load_task is not None:
+                self.logger.info("Profile load in progress; comparison skipped")
+                return
 
+            # Parsers owned by this task, so nothing else uses them concurrently
             json_parser = JsonWithCommentsParser()
             ini_parser = IniParser()
 
-            selected_json = json_parser.parse_file(json_path)
-            selected_ini = ini_parser.parse_file(ini_path)
+            def parse_selected():
+                return (
+                    config_name,
+                    json_parser.parse_file(json_path),
+                    ini_parser.parse_file(ini_path),
+                )
 
-            # Combine current and selected configuration data
-            current_data = {}
-            selected_data = {}
+            # Load selected configuration data off the UI thread
+            self._compare_task = self._start_background_task(
+                parse_selected, self._on_compare_parsed, self._on_compare_failed
+            )
+
+        except Exception as e:
+            QMessageBox.critical(
+                self, "Comparison Error", f"Error comparing configurations:\n\n{str(e)}"
+            )
 
-            # Build current data with current values (including modifications)
-            for field_path in self.config_model.field_states.keys():
-                field_info = self.config_model.get_field_info(field_path)
-                if field_info:
-                    # Create a copy of field_info with current value
-                    from copy import copy
-                    current_field_info = copy(field_info)
-                    current_field_info.value = self.config_model.get_field_value(field_path)
-                    current_data[field_path] = current_field_info
+    def _on_compare_failed(self, error_message: str) -> None:
+        """
+        Handle a failed background parse for comparison.
+
+        Args:
+            error_message: Error raised by the background task
+        """
+        self._compare_task = None
+        QMessageBox.critical(
+            self, "Comparison Error", f"Error comparing configurations:\n\n{error_message}"
+        )
+
+    def _on_compare_parsed(self, result: Tuple[str, Any, Any]) -> None:
+        """
+        Show the comparison dialog once the selected configuration is parsed.
+
+        Args:
+            result: Tuple of (configuration name, parsed JSON data, parsed INI data)
+        """
+        self._compare_task = None
+        config_name, selected_json, selected_ini = result
+
+        try:
+            # Current data with current values (including modifications); the
+            # comparison only reads the FieldInfo objects, so no copy is needed
+            current_data = self.config_model.snapshot_fields()
+            selected_data = {}
 
             # Add selected configuration JSON fields
             if selected_json:
@@ -1117,6 +1418,8 @@ class MainWindow(QMainWindow):
                     selected_data[f"ini.{field_path}"] = field_info
 
             # Show comparison dialog
+            from .dialogs.compare_dialog import ComparisonDialog
+
             dialog = ComparisonDialog(
                 current_data, selected_data, "Current Configuration", config_name, self
             )
@@ -1333,30 +1636,16 @@ class MainWindow(QMainWindow):
                 prev_index = (current_index - 1) % count
                 self.category_tabs.setCurrentIndex(prev_index)
 
-    def goto_tab_1(self) -> None:
-        """Switch to first tab."""
-        if self.category_tabs and self.category_tabs.count() > 0:
-            self.category_tabs.setCurrentIndex(0)
-
-    def goto_tab_2(self) -> None:
-        """Switch to second tab."""
-        if self.category_tabs and self.category_tabs.count() > 1:
-            self.category_tabs.setCurrentIndex(1)
-
-    def goto_tab_3(self) -> None:
-        """Switch to third tab."""
-        if self.category_tabs and self.category_tabs.count() > 2:
-            self.category_tabs.setCurrentIndex(2)
-
-    def goto_tab_4(self) -> None:
-        """Switch to fourth tab."""
-        if self.category_tabs and self.category_tabs.count() > 3:
-            self.category_tabs.setCurrentIndex(3)
+    def goto_tab(self, index: int) -> None:
+        """
+        Switch to the category tab at the given index.
 
-    def goto_tab_5(self) -> None:
-        """Switch to fifth tab."""
-        if self.category_tabs and self.category_tabs.count() > 4:
-            self.category_tabs.setCurrentIndex(4)
+        Args:
+            index: Zero-based tab index
+        """
+        tabs = self.category_tabs
+        if tabs and 0 <= index < tabs.count():
+            tabs.setCurrentIndex(index)
 
     def compare_current_config(self) -> None:
         """Compare current configuration with selected one."""
@@ -1375,8 +1664,18 @@ class MainWindow(QMainWindow):
         if not self.shortcut_manager:
             return
 
-        # Create help dialog with shortcut list
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QTextEdit
+        if self._shortcuts_dialog is None:
+            self._create_shortcuts_dialog()
+
+        if self._shortcuts_html_cache is None:
+            self._shortcuts_html_cache = self._build_shortcuts_html()
+            self._shortcuts_help_text.setText(self._shortcuts_html_cache)
+
+        self._shortcuts_dialog.exec()
+
+    def _create_shortcuts_dialog(self) -> None:
+        """Create the help dialog with the shortcut list."""
+        from PyQt6.QtWidgets import QScrollArea
 
         dialog = QDialog(self)
         dialog.setWindowTitle("Keyboard Shortcuts")
@@ -1384,60 +1683,53 @@ class MainWindow(QMainWindow):
 
         layout = QVBoxLayout(dialog)
 
-        # Create help text
-        help_text = QTextEdit()
-        help_text.setReadOnly(True)
-
-        shortcuts_html = "<h2>Keyboard Shortcuts</h2><table border='1' cellpadding='5'>"
-        shortcuts_html += "<tr><th>Action</th><th>Shortcut</th></tr>"
-
-        # Group shortcuts by category
-        categories = {
-            "File Operations": [
-                "save_config",
-                "save_config_as",
-                "open_game",
-                "reload",
-                "quit",
-            ],
-            "Edit Operations": [
-                "find",
-                "find_next",
-                "find_previous",
-                "revert_all",
-                "apply_changes",
-            ],
-            "Navigation": [
-                "next_tab",
-                "prev_tab",
-                "tab_1",
-                "tab_2",
-                "tab_3",
-                "tab_4",
-                "tab_5",
-            ],
-            "Configuration": ["export_config", "import_config", "compare_config"],
-            "General": ["escape", "help"],
-        }
-
-        for category, actions in categories.items():
-            shortcuts_html += f"<tr><td colspan='2'><b>{category}</b></td></tr>"
-            for action in actions:
-                description = self.shortcut_manager.get_shortcut_description(action)
-                shortcut = self.shortcut_manager.get_shortcut_text(action)
-                if description and shortcut:
-                    shortcuts_html += f"<tr><td>{description}</td><td><code>{shortcut}</code></td></tr>"
+        # Static rich-text label; filled in by show_help from the cached HTML
+        help_text = QLabel()
+        help_text.setTextFormat(Qt.TextFormat.RichText)
+        help_text.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
+        help_text.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        help_text.setWordWrap(True)
 
-        shortcuts_html += "</table>"
-        help_text.setHtml(shortcuts_html)
-        layout.addWidget(help_text)
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setWidget(help_text)
+        layout.addWidget(scroll_area)
 
         # Close button
         close_button = QPushButton("Close")
         close_button.clicked.connect(dialog.accept)
         layout.addWidget(close_button)
 
-        dialog.exec()
+        self._shortcuts_dialog = dialog
+        self._shortcuts_help_text = help_text
+        # Force the HTML to be (re)applied to the new widget
+        self._shortcuts_html_cache = None
+
+    def _build_shortcuts_html(self) -> str:
+        """
+        Build the HTML table listing keyboard shortcuts.
+
+        Returns:
+            HTML for the help dialog
+        """
+        parts = [
+            "<h2>Keyboard Shortcuts</h2><table border='1' cellpadding='5'>",
+            "<tr><th>Action</th><th>Shortcut</th></tr>",
+        ]
+
+        for category, rows in self.shortcut_manager.get_help_rows():
+            parts.append(f"<tr><td colspan='2'><b>{category}</b></td></tr>")
+            parts.extend(
+                f"<tr><td>{description}</td><td><code>{shortcut}</code></td></tr>"
+                for description, shortcut in rows
+            )
+
+        parts.append("</table>")
+        return "".join(parts)
+
+    def invalidate_shortcuts_cache(self) -> None:
+        """Discard the cached shortcuts help so it is rebuilt on next open."""
+        self._shortcuts_html_cache = None
 
     def on_model_changed(self, event: str, *args) -> None:
         """
@@ -1447,23 +1739,61 @@ class MainWindow(QMainWindow):
             event: Event name
             *args: Event arguments
         """
-        if event == "field_changed":
-            self.update_apply_button()
-            field_path = args[0] if args else "unknown"
-            # self.status_label.setText(f"Modified: {field_path}") # REMOVED status_label
-            self.logger.info(f"Modified: {field_path}")  # Log instead
-        elif event == "field_reverted":
-            self.update_apply_button()
-            field_path = args[0] if args else "unknown"
-            # self.status_label.setText(f"Reverted: {field_path}") # REMOVED status_label
-            self.logger.info(f"Reverted: {field_path}")  # Log instead
-        elif event == "all_changes_reverted":
-            self.update_apply_button()
-            count = args[0] if args else 0
-            # self.status_label.setText(f"Reverted {count} changes") # REMOVED status_label
-            self.logger.info(f"Reverted {count} changes")  # Log instead
-        elif event == "changes_applied":
-            self.update_apply_button()
+        # Any model change may affect which fields match a query
+        self._search_cache.clear()
+
+        handler = self._model_event_handlers.get(event)
+        if handler:
+            handler(*args)
+
+    def _on_field_changed(self, field_path: str, value: Any) -> None:
+        """
+        Handle a field value change in the model.
+
+        Args:
+            field_path: Path of the changed field
+            value: New field value
+        """
+        self.update_apply_button()
+        self.search_indexer.update_field(field_path, value)
+        # Lazy formatting: this runs on every field edit
+        self.logger.info("Modified: %s", field_path)
+
+    def _on_field_reverted(self, field_path: str) -> None:
+        """
+        Handle a field being reverted in the model.
+
+        Args:
+            field_path: Path of the reverted field
+        """
+        self.update_apply_button()
+        self.search_indexer.update_field(
+            field_path, self.config_model.get_field_value(field_path)
+        )
+        self.logger.info("Reverted: %s", field_path)
+
+    def _on_all_changes_reverted(self, count: int) -> None:
+        """
+        Handle all pending changes being reverted.
+
+        Args:
+            count: Number of reverted fields
+        """
+        self.update_apply_button()
+        self.logger.info("Reverted %d changes", count)
+
+    def _on_changes_applied(self, applied_fields: Optional[List[str]] = None) -> None:
+        """
+        Handle pending changes being written to disk.
+
+        Args:
+            applied_fields: Paths of the fields that were written, if known
+        """
+        self._last_apply_count = -1
+        self.update_apply_button()
+        # Batch the panel and field updates into a single layout/paint pass
+        self.setUpdatesEnabled(False)
+        try:
             # Update configuration panel with new change count
             if self.config_panel:
                 config_id = self.current_loaded_config_name
@@ -1478,81 +1808,101 @@ class MainWindow(QMainWindow):
                 )
             # Refresh field widgets to show non-modified state
             if self.category_tabs:
-                self.category_tabs.refresh_all_fields()
+                if applied_fields is not None:
+                    self.category_tabs.refresh_fields(applied_fields)
+                else:
+                    self.category_tabs.refresh_all_fields()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def update_apply_button(self) -> None:
         """Update the apply button state."""
         if self.apply_button:
-            self.apply_button.update_state(self.config_model.change_count)
+            count = self.config_model.change_count
+            if count == self._last_apply_count:
+                return
+            self._last_apply_count = count
+            self.apply_button.update_state(count)
 
     def show_about(self) -> None:
         """Show about dialog."""
-        QMessageBox.about(
-            self,
-            "About LMU Configuration Editor",
-            "LMU Configuration Editor v1.0.0\n\n"
-            "A desktop application for managing Le Mans Ultimate game configuration files.\n\n"
-            "Phase 2: User Interface Foundation\n"
-            "Built with PyQt6 and Python 3.12+",
-        )
+        if self._about_box is None:
+            self._about_box = QMessageBox(self)
+            self._about_box.setWindowTitle("About LMU Configuration Editor")
+            self._about_box.setText(
+                "LMU Configuration Editor v1.0.0\n\n"
+                "A desktop application for managing Le Mans Ultimate game configuration files.\n\n"
+                "Phase 2: User Interface Foundation\n"
+                "Built with PyQt6 and Python 3.12+"
+            )
+            self._about_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        self._about_box.exec()
 
     def load_window_geometry(self) -> None:
         """Load window geometry from settings."""
         geometry = self.qt_settings.value("geometry")
         if geometry:
             self.restoreGeometry(geometry)
+            self._last_saved_geometry = geometry
 
         window_state = self.qt_settings.value("windowState")
         if window_state:
             self.restoreState(window_state)
+            self._last_saved_state = window_state
 
     def save_window_geometry(self) -> None:
         """Save window geometry to settings."""
-        self.qt_settings.setValue("geometry", self.saveGeometry())
-        self.qt_settings.setValue("windowState", self.saveState())
+        # Only write values that changed to avoid redundant settings flushes
+        geometry = self.saveGeometry()
+        if geometry != self._last_saved_geometry:
+            self.qt_settings.setValue("geometry", geometry)
+            self._last_saved_geometry = geometry
+
+        window_state = self.saveState()
+        if window_state != self._last_saved_state:
+            self.qt_settings.setValue("windowState", window_state)
+            self._last_saved_state = window_state
+
+    def moveEvent(self, event: QMoveEvent) -> None:
+        """Handle window move event to track geometry changes."""
+        if self.isVisible():
+            self._geometry_dirty = True
+        super().moveEvent(event)
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         """Handle window resize event to maintain splitter ratio."""
-        if hasattr(self, 'splitter') and self.splitter and self.splitter.count() == 2:
-            # Allow a very small delay for the layout to settle before calculating sizes
-            # This can sometimes help if direct resize calculations are off due to pending layout updates
-            QTimer.singleShot(0, self._adjust_splitter_sizes)
+        if self.isVisible():
+            self._geometry_dirty = True
+        if self._splitter_ready:
+            # The layout has already resized the splitter, so adjust it inline once
+            # its panels have real widths; before that, let the layout settle first
+            if self.splitter.width() > 0 and self.splitter.widget(0).width() > 0:
+                self._splitter_resize_timer.stop()
+                self._adjust_splitter_sizes()
+            else:
+                self._splitter_resize_timer.start()
         super().resizeEvent(event)
 
     def _adjust_splitter_sizes(self) -> None:
-        """Adjusts splitter sizes. Called by resizeEvent via QTimer."""
-        if hasattr(self, 'splitter') and self.splitter and self.splitter.count() == 2:
-            # Check if widgets are visible and have a width, otherwise splitter width might be 0
-            if self.splitter.width() > 0 :
-                total_width = self.splitter.width()
-                
-                # Get current sizes to respect minimums if possible, though stretch factors should handle this
-                # current_sizes = self.splitter.sizes()
-                
-                left_width = int(total_width * 0.84)
-                right_width = total_width - left_width # Ensure total width is maintained
-
-                # Ensure minimum sizes are respected (QSplitter does this implicitly, but good to be aware)
-                # min_left = self.category_tabs.minimumSizeHint().width() if self.category_tabs else 0
-                # min_right = self.config_panel.minimumSizeHint().width() if self.config_panel else 0
-                # if left_width < min_left:
-                #     left_width = min_left
-                #     right_width = total_width - left_width
-                # if right_width < min_right and total_width - left_width >= min_right : # check if right can meet min
-                #      right_width = min_right
-                #      left_width = total_width - right_width
-                # elif right_width < min_right: # if right cannot meet min, adjust left to give right its min
-                #      left_width = total_width - min_right
-                #      right_width = min_right
-
-
-                if left_width > 0 and right_width > 0:
-                     # Check if current sizes are already very close to target to avoid jitter
-                    current_sizes = self.splitter.sizes()
-                    if abs(current_sizes[0] - left_width) > 2 or abs(current_sizes[1] - right_width) > 2:
-                        self.splitter.setSizes([left_width, right_width])
-                # self.logger.debug(f"Splitter resize: total={total_width}, L={left_width}, R={right_width}, current={self.splitter.sizes()}")
+        """Adjusts splitter sizes. Called by resizeEvent, directly or via the settle timer."""
+        if not self._splitter_ready or not self.splitter.isVisible():
+            return
+
+        # Read all geometry first, then issue a single write
+        total_width = self.splitter.width()
+        current_sizes = self.splitter.sizes()
+        # Splitter width might be 0 before the widgets are laid out
+        if total_width <= 0:
+            return
+
+        left_width = int(total_width * 0.84)
+        right_width = total_width - left_width  # Ensure total width is maintained
 
+        # QSplitter enforces the panels' minimum sizes itself
+        if left_width > 0 and right_width > 0:
+            # Check if current sizes are already very close to target to avoid jitter
+            if abs(current_sizes[0] - left_width) > 2 or abs(current_sizes[1] - right_width) > 2:
+                self.splitter.setSizes([left_width, right_width])
 
     def closeEvent(self, event) -> None:
         """Handle window close event."""
@@ -1583,8 +1933,9 @@ class MainWindow(QMainWindow):
                 event.ignore()
                 return
 
-        # Save window geometry
-        self.save_window_geometry()
+        # Save window geometry if the window was moved or resized
+        if self._geometry_dirty:
+            self.save_window_geometry()
 
         # Accept the close event
         event.accept()
@@ -1613,10 +1964,40 @@ class MainWindow(QMainWindow):
 
     def show_startup_info_dialog(self, json_path: Optional[Path], ini_path: Optional[Path], game_path_used: Optional[Path], is_example: bool) -> None:
         """Shows the startup information dialog."""
+        from .dialogs.startup_info_dialog import StartupInfoDialog
+
         dialog = StartupInfoDialog(json_path, ini_path, game_path_used, is_example, self)
         dialog.browse_requested.connect(self.browse_for_game)
         dialog.exec()
 
+    def _get_sync_check_key(self, json_file: Path, ini_file: Path) -> Tuple:
+        """
+        Build the key identifying the state compared by check_profile_sync.
+
+        Missing files get a None mtime, so they change the key without
+        raising; sync_with_active_profile then reports them as before.
+
+        Args:
+            json_file: Current settings.json file
+            ini_file: Current Config_DX11.ini file
+
+        Returns:
+            Tuple of the active profile name and the mtimes of all four files
+        """
+        active_profile = self.profile_manager.get_active_profile()
+        paths = [json_file, ini_file]
+        if active_profile:
+            profile_dir = self.profile_manager.get_profiles_directory() / active_profile
+            paths += [profile_dir / "settings.json", profile_dir / "Config_DX11.ini"]
+
+        mtimes = []
+        for path in paths:
+            try:
+                mtimes.append(path.stat().st_mtime_ns)
+            except FileNotFoundError:
+                mtimes.append(None)
+        return (active_profile, *mtimes)
+
     def check_profile_sync(self, json_file: Path, ini_file: Path) -> None:
         """
         Check if current settings match the active profile and handle conflicts.
@@ -1625,20 +2006,36 @@ class MainWindow(QMainWindow):
             json_file: Current settings.json file
             ini_file: Current Config_DX11.ini file
         """
+        if self._profile_load_task is not None:
+            # The profile load writes these files itself once it finishes
+            return
+
         try:
-            files_match, active_profile, differences = self.profile_manager.compare_with_active_profile(
-                json_file, ini_file
+            # Skip the comparison if neither the active profile nor any of the
+            # game or profile files changed since the files last matched
+            sync_key = self._get_sync_check_key(json_file, ini_file)
+            if sync_key == self._last_sync_check and self.config_model.change_count == 0:
+                return
+
+            files_match, active_profile, differences, current_contents = (
+                self.profile_manager.sync_with_active_profile(json_file, ini_file)
             )
+
+            self._last_sync_check = sync_key if files_match else None
             
             if not files_match and active_profile and differences:
                 self.logger.info(f"Profile sync conflict detected with profile '{active_profile}': {differences}")
                 
                 # Show sync dialog
+                from .dialogs.profile_sync_dialog import ProfileSyncDialog, ProfileSyncChoice
+
                 choice = ProfileSyncDialog.show_sync_dialog(active_profile, differences, self)
                 
                 if choice == ProfileSyncChoice.UPDATE_PROFILE:
-                    # Update profile with current settings
-                    if self.profile_manager.update_profile(active_profile, json_file, ini_file):
+                    # Update profile with the settings read during the comparison
+                    if self.profile_manager.update_profile_from_contents(
+                        active_profile, current_contents
+                    ):
                         self.logger.info(f"Profile '{active_profile}' updated with current settings")
                         QMessageBox.information(
                             self,
@@ -4,12 +4,15 @@ Virtual scrolling implementation for large lists of configuration fields.
 Provides smooth scrolling performance by only rendering visible items.
 """
 
-import math
-from typing import List, Optional, Callable, Any, Dict
+import bisect
+import itertools
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Callable, Any, Dict
 import logging
 
 from PyQt6.QtWidgets import QScrollArea, QWidget, QVBoxLayout, QFrame
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QSignalBlocker, pyqtSignal
 
 
 class VirtualItem:
@@ -39,10 +42,23 @@ class ItemPool:
         self.widget_factory = widget_factory
         self.available_widgets: List[QWidget] = []
         self.used_widgets: Dict[int, QWidget] = {}  # index -> widget
+        # Spare widgets kept beyond this are deleted instead of pooled
+        self.max_pool_size = max(32, initial_size)
         self.logger = logging.getLogger(__name__)
 
         # Pre-create initial widgets
-        for _ in range(initial_size):
+        self.reserve(initial_size)
+
+    def reserve(self, total: int) -> None:
+        """
+        Pre-create widgets until the pool holds at least the given number.
+
+        Args:
+            total: Number of widgets (used and available) the pool should hold
+        """
+        self.max_pool_size = max(self.max_pool_size, total)
+        missing = total - len(self.available_widgets) - len(self.used_widgets)
+        for _ in range(missing):
             widget = self.widget_factory(None)
             widget.hide()
             self.available_widgets.append(widget)
@@ -83,12 +99,14 @@ class ItemPool:
             index: Item index
         """
         if index in self.used_widgets:
-            widget = self.used_widgets[index]
+            widget = self.used_widgets.pop(index)
             widget.hide()
             widget.setParent(None)
 
-            self.available_widgets.append(widget)
-            del self.used_widgets[index]
+            if len(self.available_widgets) < self.max_pool_size:
+                self.available_widgets.append(widget)
+            else:
+                widget.deleteLater()
 
     def clear(self) -> None:
         """Clear all widgets from the pool."""
@@ -115,13 +133,19 @@ class VirtualScrollArea(QScrollArea):
     item_double_clicked = pyqtSignal(int, object)  # index, data
     selection_changed = pyqtSignal(int)  # selected_index
 
-    def __init__(self, widget_factory: Callable[[Any], QWidget], parent=None):
+    def __init__(
+        self,
+        widget_factory: Callable[[Any], QWidget],
+        parent=None,
+        preload_size: int = 10,
+    ):
         """
         Initialize the virtual scroll area.
 
         Args:
             widget_factory: Function to create widgets for items
             parent: Parent widget
+            preload_size: Widgets to create up front, before the viewport is sized
         """
         super().__init__(parent)
 
@@ -134,14 +158,26 @@ class VirtualScrollArea(QScrollArea):
         self.visible_range = (0, 0)  # (start_index, end_index)
         self.selected_index = -1
 
+        # Cumulative item offsets for locating items by y position
+        self._y_offsets: List[int] = []
+        self._total_height = 0
+        self._last_range_hint = 0
+        # Set when every item fits the viewport and is rendered, so scrolling
+        # needs no further work until the items change
+        self._rendered_all = False
+
         # Widget pool for recycling
-        self.item_pool = ItemPool(widget_factory)
+        self.item_pool = ItemPool(widget_factory, preload_size)
 
         # Viewport and content
         self.content_widget = QFrame()
         self.content_layout = QVBoxLayout(self.content_widget)
         self.content_layout.setContentsMargins(0, 0, 0, 0)
         self.content_layout.setSpacing(0)
+        # Default selection styling, parsed once and matched via the selected property
+        self.content_widget.setStyleSheet(
+            'QWidget[selected="true"] { background-color: #0078d4; color: white; }'
+        )
 
         # Set up scroll area
         self.setWidget(self.content_widget)
@@ -151,15 +187,25 @@ class VirtualScrollArea(QScrollArea):
 
         # Performance settings
         self.viewport_margin = 5  # Extra items to render outside viewport
-        self.update_threshold = 10  # Minimum scroll distance before update
+        self.frame_interval_ms = 16  # ~60 FPS upper bound on scroll updates
+        self._last_update_ns = 0
 
-        # Update timer to avoid excessive updates
+        # Timer for the trailing update of a throttled scroll burst
         self.update_timer = QTimer()
         self.update_timer.setSingleShot(True)
         self.update_timer.timeout.connect(self._delayed_update_visible_items)
 
+        # Cached for the scroll hot path; the height is refreshed in resizeEvent
+        self._vbar = self.verticalScrollBar()
+        self._viewport_height = self.viewport().height()
+
+        # Scroll position retention across set_items
+        self._stick_bottom = False
+        self._scroll_anchor: Optional[int] = None
+
         # Connect scroll events
-        self.verticalScrollBar().valueChanged.connect(self._on_scroll)
+        self._vbar.valueChanged.connect(self._on_scroll)
+        self._vbar.rangeChanged.connect(self._on_scroll_range_changed)
 
         # Initial setup
         self._setup_spacers()
@@ -175,24 +221,32 @@ class VirtualScrollArea(QScrollArea):
         if item_height is not None:
             self.item_height = item_height
 
-        # Clear current items
-        self.clear_items()
+        # Remember the first item in view so the position survives the rebuild
+        first_visible = self._find_item_index(self._vbar.value()) if self.items else 0
 
-        # Create virtual items
-        self.items = []
-        y_pos = 0
-        for data in items:
-            virtual_item = VirtualItem(data, self.item_height)
-            virtual_item.y_position = y_pos
-            self.items.append(virtual_item)
-            y_pos += self.item_height
+        with self._batched_updates():
+            # Clear current items
+            self.clear_items()
 
-        # Update content height
-        total_height = len(self.items) * self.item_height
-        self.content_widget.setMinimumHeight(total_height)
+            # Create virtual items
+            self.items = [VirtualItem(data, self.item_height) for data in items]
+            self._recalculate_positions()
 
-        # Update visible items
-        self._update_visible_items()
+            # Update content height
+            self.content_widget.setMinimumHeight(self._total_height)
+
+            # Restore the position now where possible; otherwise once the
+            # scroll bar range catches up with the new content height
+            max_offset = max(0, self._total_height - self._viewport_height)
+            if self._stick_bottom:
+                target = max_offset
+            else:
+                target = min(self._offset_of(first_visible), max_offset)
+            self._vbar.setValue(target)
+            self._scroll_anchor = target if target > self._vbar.maximum() else None
+
+            # Update visible items
+            self._update_visible_items()
 
         self.logger.debug(f"Set {len(items)} items with height {self.item_height}")
 
@@ -205,20 +259,23 @@ class VirtualScrollArea(QScrollArea):
             index: Position to insert (-1 for append)
         """
         virtual_item = VirtualItem(data, self.item_height)
+        self._rendered_all = False
 
         if index == -1 or index >= len(self.items):
             # Append
-            virtual_item.y_position = len(self.items) * self.item_height
+            virtual_item.y_position = self._total_height
             self.items.append(virtual_item)
+            self._y_offsets.append(self._total_height)
+            self._total_height += virtual_item.height
         else:
-            # Insert at position
+            # Insert at position; rendered widgets no longer match their indices
+            self._release_rendered_items()
             self.items.insert(index, virtual_item)
-            # Update positions for all items after insertion
-            self._recalculate_positions()
+            # Update positions for the inserted item and those after it
+            self._recalculate_positions(index)
 
         # Update content height
-        total_height = len(self.items) * self.item_height
-        self.content_widget.setMinimumHeight(total_height)
+        self.content_widget.setMinimumHeight(self._total_height)
 
         # Update visible items
         self._update_visible_items()
@@ -234,19 +291,17 @@ class VirtualScrollArea(QScrollArea):
             True if removed successfully
         """
         if 0 <= index < len(self.items):
-            # Return widget to pool if it's visible
-            if index in self.item_pool.used_widgets:
-                self.item_pool.return_widget(index)
+            # Rendered widgets after the removed item no longer match their indices
+            self._release_rendered_items()
 
             # Remove item
             self.items.pop(index)
 
-            # Update positions
-            self._recalculate_positions()
+            # Update positions for the items that moved up
+            self._recalculate_positions(index)
 
             # Update content height
-            total_height = len(self.items) * self.item_height
-            self.content_widget.setMinimumHeight(total_height)
+            self.content_widget.setMinimumHeight(self._total_height)
 
             # Update selection
             if self.selected_index == index:
@@ -263,16 +318,20 @@ class VirtualScrollArea(QScrollArea):
 
     def clear_items(self) -> None:
         """Clear all items from the virtual list."""
-        # Return all widgets to pool
-        self.item_pool.clear()
+        with self._batched_updates():
+            # Return all widgets to pool, keeping them for the next items
+            self._release_rendered_items()
 
-        # Clear items
-        self.items.clear()
-        self.selected_index = -1
-        self.visible_range = (0, 0)
+            # Clear items
+            self.items.clear()
+            self._y_offsets = []
+            self._total_height = 0
+            self._last_range_hint = 0
+            self.selected_index = -1
+            self.visible_range = (0, 0)
 
-        # Reset content height
-        self.content_widget.setMinimumHeight(0)
+            # Reset content height
+            self.content_widget.setMinimumHeight(0)
 
         self.logger.debug("Cleared all items")
 
@@ -288,10 +347,9 @@ class VirtualScrollArea(QScrollArea):
             y_position = item.y_position
 
             # Calculate scroll position to center the item
-            viewport_height = self.viewport().height()
-            scroll_pos = max(0, y_position - viewport_height // 2)
+            scroll_pos = max(0, y_position - self._viewport_height // 2)
 
-            self.verticalScrollBar().setValue(scroll_pos)
+            self._vbar.setValue(scroll_pos)
 
     def get_selected_item(self) -> Optional[Any]:
         """
@@ -340,34 +398,88 @@ class VirtualScrollArea(QScrollArea):
         self.bottom_spacer.setFixedHeight(0)
         self.content_layout.addWidget(self.bottom_spacer)
 
+    def resizeEvent(self, event) -> None:
+        """Handle resizes by caching the viewport height and filling the widget pool."""
+        super().resizeEvent(event)
+        self._viewport_height = self.viewport().height()
+        needed = (
+            self._viewport_height // max(1, self.item_height)
+            + 1
+            + 2 * self.viewport_margin
+        )
+        self.item_pool.reserve(needed)
+
+    @contextmanager
+    def _batched_updates(self) -> Iterator[None]:
+        """Block scroll signals and repaints while the content is being changed."""
+        blocker = QSignalBlocker(self._vbar)
+        was_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(was_enabled)
+            blocker.unblock()
+
+    def _on_scroll_range_changed(self, minimum: int, maximum: int) -> None:
+        """Keep the scroll position anchored when the content height changes."""
+        if self._scroll_anchor is not None:
+            self._vbar.setValue(min(self._scroll_anchor, maximum))
+            self._scroll_anchor = None
+        elif self._stick_bottom:
+            self._vbar.setValue(maximum)
+
     def _on_scroll(self, value: int) -> None:
         """Handle scroll bar value changes."""
-        # Use timer to avoid excessive updates during scrolling
-        self.update_timer.start(16)  # ~60 FPS
+        self._stick_bottom = 0 < value == self._vbar.maximum()
+
+        # Throttle with a leading edge: update immediately when idle, otherwise
+        # coalesce the rest of the frame into a single trailing update
+        elapsed_ms = (time.monotonic_ns() - self._last_update_ns) // 1_000_000
+        if elapsed_ms >= self.frame_interval_ms:
+            self.update_timer.stop()
+            self._delayed_update_visible_items()
+        elif not self.update_timer.isActive():
+            self.update_timer.start(self.frame_interval_ms - elapsed_ms)
 
     def _delayed_update_visible_items(self) -> None:
-        """Update visible items after scroll delay."""
+        """Update visible items and record when the update happened."""
+        self._last_update_ns = time.monotonic_ns()
         self._update_visible_items()
 
     def _update_visible_items(self) -> None:
         """Update which items are visible and rendered."""
-        if not self.items:
+        if not self.items or self._rendered_all:
+            return
+
+        # Small lists are cheaper to render in full than to virtualize
+        item_height = max(1, self.item_height)
+        capacity = -(-self._viewport_height // item_height) + 2 * self.viewport_margin
+        if len(self.items) <= capacity:
+            self._rendered_all = True
+            all_items = (0, len(self.items))
+            if all_items != self.visible_range:
+                self._render_visible_range(all_items)
+                self.visible_range = all_items
             return
 
         # Calculate visible range
-        viewport_rect = self.viewport().rect()
-        scroll_offset = self.verticalScrollBar().value()
+        scroll_offset = self._vbar.value()
 
         # Determine which items should be visible
         start_y = scroll_offset - (self.viewport_margin * self.item_height)
         end_y = (
             scroll_offset
-            + viewport_rect.height()
+            + self._viewport_height
             + (self.viewport_margin * self.item_height)
         )
 
-        start_index = max(0, int(start_y // self.item_height))
-        end_index = min(len(self.items), int(math.ceil(end_y / self.item_height)))
+        start_index = self._find_item_index(start_y)
+        end_index = min(len(self.items), bisect.bisect_left(self._y_offsets, end_y))
+        self._last_range_hint = start_index
+
+        # Keep enough spare widgets to refill a whole viewport plus margins
+        self.item_pool.max_pool_size = max(32, end_index - start_index)
 
         new_visible_range = (start_index, end_index)
 
@@ -384,46 +496,112 @@ class VirtualScrollArea(QScrollArea):
             visible_range: (start_index, end_index) tuple
         """
         start_index, end_index = visible_range
+        old_start, old_end = self.visible_range
+
+        with self._batched_updates():
+            # Rendered widgets always lie in the previous range, so only the parts of
+            # it outside the new range need to be returned to the pool
+            for i in range(old_start, min(start_index, old_end)):
+                self._evict_widget(i)
+            for i in range(max(end_index, old_start), old_end):
+                self._evict_widget(i)
+
+            # Widgets in the overlap stay in the layout; only the delta is added
+            keep_start = max(start_index, old_start)
+            keep_end = min(end_index, old_end)
+            if keep_start >= keep_end:
+                keep_start = keep_end = end_index
+
+            # Calculate spacer heights
+            top_spacer_height = self._offset_of(start_index)
+            bottom_spacer_height = self._total_height - self._offset_of(end_index)
+
+            self.top_spacer.setFixedHeight(top_spacer_height)
+            self.bottom_spacer.setFixedHeight(bottom_spacer_height)
+
+            # Render newly visible items above the kept ones, then below them.
+            # end_index is already clamped to the item count by _update_visible_items.
+            items = self.items
+            prepare_widget = self._prepare_widget
+            insert_widget = self.visible_layout.insertWidget
+            for i, item in enumerate(items[start_index:keep_start], start=start_index):
+                insert_widget(i - start_index, prepare_widget(i, item))
+            add_widget = self.visible_layout.addWidget
+            for i, item in enumerate(items[keep_end:end_index], start=keep_end):
+                add_widget(prepare_widget(i, item))
 
-        # Return widgets that are no longer visible
-        for i in list(self.item_pool.used_widgets.keys()):
-            if i < start_index or i >= end_index:
-                self.item_pool.return_widget(i)
+        self.logger.debug(f"Rendered items {start_index}-{end_index}")
 
-        # Clear visible layout
-        while self.visible_layout.count():
-            child = self.visible_layout.takeAt(0)
-            if child.widget():
-                child.widget().hide()
+    def _prepare_widget(self, index: int, item: VirtualItem) -> QWidget:
+        """Get a pooled widget for an item, updated and shown."""
+        widget = self.item_pool.get_widget(index, item.data)
+        self._update_widget_selection_state(widget, index == self.selected_index)
+        widget.show()
+        return widget
 
-        # Calculate spacer heights
-        top_spacer_height = start_index * self.item_height
-        bottom_spacer_height = (len(self.items) - end_index) * self.item_height
+    def _evict_widget(self, index: int) -> None:
+        """Remove an item's widget from the layout and return it to the pool."""
+        widget = self.item_pool.used_widgets.get(index)
+        if widget is not None:
+            self.visible_layout.removeWidget(widget)
+            self.item_pool.return_widget(index)
+
+    def _release_rendered_items(self) -> None:
+        """Return all rendered widgets so the next update renders from scratch."""
+        for i in range(*self.visible_range):
+            self._evict_widget(i)
+        self.visible_range = (0, 0)
+        self._rendered_all = False
 
-        self.top_spacer.setFixedHeight(top_spacer_height)
-        self.bottom_spacer.setFixedHeight(bottom_spacer_height)
+    def _recalculate_positions(self, start: int = 0) -> None:
+        """
+        Recalculate Y positions and cumulative offsets.
 
-        # Render visible items
-        for i in range(start_index, end_index):
-            if i < len(self.items):
-                item = self.items[i]
-                widget = self.item_pool.get_widget(i, item.data)
+        Args:
+            start: First item whose position may have changed; earlier items
+                keep their offsets
+        """
+        offsets = self._y_offsets
+        if start > 0:
+            previous = self.items[start - 1]
+            y_pos = previous.y_position + previous.height
+        else:
+            y_pos = 0
+        del offsets[start:]
 
-                # Update widget selection state
-                self._update_widget_selection_state(widget, i == self.selected_index)
+        for item in itertools.islice(self.items, start, None):
+            item.y_position = y_pos
+            offsets.append(y_pos)
+            y_pos += item.height
 
-                # Add to layout
-                widget.show()
-                self.visible_layout.addWidget(widget)
+        self._total_height = y_pos
 
-        self.logger.debug(f"Rendered items {start_index}-{end_index}")
+    def _offset_of(self, index: int) -> int:
+        """Get the y offset where the item at index starts (total height past the end)."""
+        if index < len(self._y_offsets):
+            return self._y_offsets[index]
+        return self._total_height
 
-    def _recalculate_positions(self) -> None:
-        """Recalculate Y positions for all items."""
-        y_pos = 0
-        for item in self.items:
-            item.y_position = y_pos
-            y_pos += item.height
+    def _find_item_index(self, y: float) -> int:
+        """
+        Find the index of the item containing the given y position.
+
+        Args:
+            y: Content y position
+
+        Returns:
+            Item index, clamped to the valid range
+        """
+        offsets = self._y_offsets
+        count = len(offsets)
+
+        # Steady scrolling usually stays on or next to the previous start item
+        hint = self._last_range_hint
+        for i in (hint, hint + 1, hint - 1):
+            if 0 <= i < count and offsets[i] <= y < self._offset_of(i + 1):
+                return i
+
+        return min(max(0, bisect.bisect_right(offsets, y) - 1), max(0, count - 1))
 
     def _update_item_selection(self, index: int) -> None:
         """Update selection state for a specific item."""
@@ -435,12 +613,11 @@ class VirtualScrollArea(QScrollArea):
         """Update the selection state of a widget."""
         if hasattr(widget, "set_selected"):
             widget.set_selected(selected)
-        else:
-            # Default selection styling
-            if selected:
-                widget.setStyleSheet("background-color: #0078d4; color: white;")
-            else:
-                widget.setStyleSheet("")
+        elif widget.property("selected") != selected:
+            # Default selection styling from the content widget's stylesheet
+            widget.setProperty("selected", selected)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
 
     def get_item_count(self) -> int:
         """Get the total number of items."""
@@ -508,8 +685,9 @@ class VirtualListWidget(QWidget):
 
     def set_items(self, items: List[Any], item_height: int = None) -> None:
         """Set items in the list."""
-        self.original_items = items.copy()
-        self.filtered_items = items.copy()
+        self.original_items = list(items)
+        # Unfiltered view shares the original list; filters build a new one
+        self.filtered_items = self.original_items
         self.scroll_area.set_items(self.filtered_items, item_height)
 
     def filter_items(self, filter_func: Callable[[Any], bool]) -> None:
@@ -519,9 +697,7 @@ class VirtualListWidget(QWidget):
         Args:
             filter_func: Function that returns True for items to keep
         """
-        self.filtered_items = [
-            item for item in self.original_items if filter_func(item)
-        ]
+        self.filtered_items = list(filter(filter_func, self.original_items))
         self.scroll_area.set_items(self.filtered_items)
 
     def search_items(self, query: str, search_func: Callable[[Any, str], bool]) -> None:
@@ -538,7 +714,7 @@ class VirtualListWidget(QWidget):
                 item for item in self.original_items if search_func(item, query)
             ]
         else:
-            self.filtered_items = self.original_items.copy()
+            self.filtered_items = self.original_items
 
         self.scroll_area.set_items(self.filtered_items)
 
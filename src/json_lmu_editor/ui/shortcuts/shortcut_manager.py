@@ -4,13 +4,42 @@ Keyboard shortcut management for the LMU Configuration Editor.
 Provides centralized management of keyboard shortcuts with tooltip updates.
 """
 
-from typing import Dict, Callable, Optional
+from typing import Dict, Callable, List, Optional, Tuple
 import logging
 
 from PyQt6.QtWidgets import QMainWindow, QWidget
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtGui import QKeySequence, QShortcut, QAction
 
+# Action names shown in the help dialog, grouped by category
+_SHORTCUT_CATEGORIES = {
+    "File Operations": [
+        "save_config",
+        "save_config_as",
+        "open_game",
+        "reload",
+        "quit",
+    ],
+    "Edit Operations": [
+        "find",
+        "find_next",
+        "find_previous",
+        "revert_all",
+        "apply_changes",
+    ],
+    "Navigation": [
+        "next_tab",
+        "prev_tab",
+        "tab_1",
+        "tab_2",
+        "tab_3",
+        "tab_4",
+        "tab_5",
+    ],
+    "Configuration": ["export_config", "import_config", "compare_config"],
+    "General": ["escape", "help"],
+}
+
 
 class ShortcutManager(QObject):
     """Manages keyboard shortcuts for the application."""
@@ -38,6 +67,31 @@ class ShortcutManager(QObject):
             "apply_changes": ("Ctrl+S", "Apply all pending changes", "apply_changes"),
         }
 
+        # Help dialog rows as (category, [(description, shortcut), ...])
+        self._help_rows: List[Tuple[str, List[Tuple[str, str]]]] = []
+        self._build_help_rows()
+
+    def _build_help_rows(self) -> None:
+        """Resolve the help dialog rows from the current shortcut map."""
+        self._help_rows = []
+        for category, actions in _SHORTCUT_CATEGORIES.items():
+            rows = []
+            for action in actions:
+                description = self.get_shortcut_description(action)
+                shortcut = self.get_shortcut_text(action)
+                if description and shortcut:
+                    rows.append((description, shortcut))
+            self._help_rows.append((category, rows))
+
+    def get_help_rows(self) -> List[Tuple[str, List[Tuple[str, str]]]]:
+        """
+        Get the shortcut rows for the help dialog.
+
+        Returns:
+            List of (category, [(description, shortcut), ...]) tuples
+        """
+        return self._help_rows
+
     def register_shortcuts(self) -> None:
         """Register all keyboard shortcuts for the main window."""
         self.logger.info("Registering keyboard shortcuts")
@@ -254,6 +308,7 @@ class ShortcutManager(QObject):
 
         # Create the shortcut
         shortcut_obj = self.create_shortcut(name, shortcut, description, callback)
+        self._invalidate_help_cache()
         return shortcut_obj is not None
 
     def remove_shortcut(self, action_name: str) -> bool:
@@ -282,8 +337,17 @@ class ShortcutManager(QObject):
             del self.shortcut_map[action_name]
             removed = True
 
+        if removed:
+            self._invalidate_help_cache()
+
         return removed
 
+    def _invalidate_help_cache(self) -> None:
+        """Tell the main window that the shortcut list has changed."""
+        self._build_help_rows()
+        if hasattr(self.main_window, "invalidate_shortcuts_cache"):
+            self.main_window.invalidate_shortcuts_cache()
+
 
 class KeyboardNavigationMixin:
     """Mixin class to add keyboard navigation capabilities to widgets."""
@@ -4,34 +4,92 @@ Apply changes button widget.
 Provides a stateful button for applying configuration changes.
 """
 
+from typing import Optional
+
 from PyQt6.QtWidgets import QPushButton, QWidget
-from PyQt6.QtCore import QTimer, QPropertyAnimation, QEasingCurve
+from PyQt6.QtCore import QTimer
 
 
 class ApplyChangesButton(QPushButton):
     """Button for applying configuration changes with visual state feedback."""
 
+    # Parsed once per button; states are switched through the applyState property
+    _STYLESHEET = """
+        QPushButton {
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+        }
+        QPushButton[applyState="enabled"] {
+            background-color: #2196F3;
+            color: white;
+            font-weight: bold;
+        }
+        QPushButton[applyState="enabled"]:hover {
+            background-color: #1976D2;
+        }
+        QPushButton[applyState="enabled"]:pressed {
+            background-color: #0D47A1;
+        }
+        QPushButton[applyState="disabled"] {
+            background-color: #e0e0e0;
+            color: #999;
+        }
+        QPushButton[applyState="saving"] {
+            background-color: #FF9800;
+            color: white;
+            font-weight: bold;
+        }
+        QPushButton[applyState="success"] {
+            background-color: #4CAF50;
+            color: white;
+            font-weight: bold;
+        }
+        QPushButton[applyState="error"] {
+            background-color: #F44336;
+            color: white;
+            font-weight: bold;
+        }
+        QPushButton[applyState="error"]:hover {
+            background-color: #D32F2F;
+        }
+    """
+
     def __init__(self, parent: QWidget = None):
         """Initialize the apply changes button."""
         super().__init__("Apply Changes", parent)
 
         # Initial state
         self.change_count = 0
-        self.current_state = "disabled"
+        self.current_state = ""
+        self.setStyleSheet(self._STYLESHEET)
 
-        # Animation for state changes
-        self.animation = QPropertyAnimation(self, b"geometry")
-        self.animation.setDuration(200)
-        self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-
-        # Timer for temporary states
-        self.state_timer = QTimer()
-        self.state_timer.setSingleShot(True)
-        self.state_timer.timeout.connect(self.reset_to_normal_state)
+        # Timer for temporary states, created when first needed
+        self.state_timer: Optional[QTimer] = None
 
         # Initial setup
         self.update_state(0)
 
+    def _apply_state(self, state: str, text: str, enabled: bool) -> None:
+        """
+        Switch the button to a visual state.
+
+        Args:
+            state: State name matched by the stylesheet's applyState selectors
+            text: Button text for the state
+            enabled: Whether the button is clickable in the state
+        """
+        if self.isEnabled() != enabled:
+            self.setEnabled(enabled)
+        if self.text() != text:
+            self.setText(text)
+        if state != self.current_state:
+            self.setProperty("applyState", state)
+            # Re-polish so the property selectors are re-evaluated
+            self.style().unpolish(self)
+            self.style().polish(self)
+            self.current_state = state
+
     def update_state(self, change_count: int) -> None:
         """
         Update button state based on change count.
@@ -42,73 +100,20 @@ class ApplyChangesButton(QPushButton):
         self.change_count = change_count
 
         if change_count > 0:
-            self.setEnabled(True)
-            self.setText(f"Apply Changes ({change_count})")
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #2196F3;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #1976D2;
-                }
-                QPushButton:pressed {
-                    background-color: #0D47A1;
-                }
-            """)
-            self.current_state = "enabled"
+            self._apply_state("enabled", "Apply Changes (%d)" % change_count, True)
         else:
-            self.setEnabled(False)
-            self.setText("Apply Changes")
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #e0e0e0;
-                    color: #999;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                }
-            """)
-            self.current_state = "disabled"
+            self._apply_state("disabled", "Apply Changes", False)
 
     def set_saving_state(self) -> None:
         """Set button to saving state."""
-        self.setEnabled(False)
-        self.setText("Saving...")
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-        """)
-        self.current_state = "saving"
+        self._apply_state("saving", "Saving...", False)
 
     def set_success_state(self) -> None:
         """Set button to success state temporarily."""
-        self.setEnabled(False)
-        self.setText("Changes Saved ✓")
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-        """)
-        self.current_state = "success"
+        self._apply_state("success", "Changes Saved ✓", False)
 
         # Return to normal state after delay
-        self.state_timer.start(2000)
+        self._start_state_timer(2000)
 
     def set_error_state(self, error_message: str = "Save Failed") -> None:
         """
@@ -117,26 +122,24 @@ class ApplyChangesButton(QPushButton):
         Args:
             error_message: Error message to display
         """
-        self.setEnabled(True)
-        self.setText("Save Failed ✗")
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #F44336;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #D32F2F;
-            }
-        """)
-        self.current_state = "error"
+        self._apply_state("error", "Save Failed ✗", True)
         self.setToolTip(error_message)
 
         # Return to normal state after delay
-        self.state_timer.start(3000)
+        self._start_state_timer(3000)
+
+    def _start_state_timer(self, delay_ms: int) -> None:
+        """
+        Schedule the return to the normal state.
+
+        Args:
+            delay_ms: Delay before resetting, in milliseconds
+        """
+        if self.state_timer is None:
+            self.state_timer = QTimer(self)
+            self.state_timer.setSingleShot(True)
+            self.state_timer.timeout.connect(self.reset_to_normal_state)
+        self.state_timer.start(delay_ms)
 
     def reset_to_normal_state(self) -> None:
         """Reset button to normal state based on current change count."""
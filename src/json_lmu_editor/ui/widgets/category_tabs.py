@@ -4,7 +4,7 @@ Category tab widget for organizing configuration fields.
 Provides tabbed interface for different configuration categories.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 import logging
 
 from PyQt6.QtWidgets import (
@@ -41,6 +41,8 @@ class MultiRowTabWidget(QWidget):
 
         # Field widgets by path
         self.field_widgets: Dict[str, FieldWidget] = {}
+        # Tab index containing each field, filled as tabs are added
+        self.field_tab_indices: Dict[str, int] = {}
 
         # Search highlighting
         self.highlighted_fields: List[str] = []
@@ -334,6 +336,7 @@ class CategoryTabWidget(MultiRowTabWidget):
         # Clear existing tabs
         self.clear()
         self.field_widgets.clear()
+        self.field_tab_indices.clear()
 
         # Separate JSON and DX11 categories, and identify small categories
         large_json_categories = {}
@@ -357,14 +360,16 @@ class CategoryTabWidget(MultiRowTabWidget):
         for category_name, field_paths in large_json_categories.items():
             tab_widget = self.create_category_tab(category_name, field_paths)
             display_name = self._format_tab_name(category_name)
-            self.addTab(tab_widget, display_name)
+            tab_index = self.addTab(tab_widget, display_name)
+            self._index_tab_fields(tab_index, field_paths)
 
         # Add Misc tab if there are small categories
         if misc_fields:
             misc_tab_widget = self.create_misc_tab(
                 small_categories
             )  # Removed all_misc_fields
-            self.addTab(misc_tab_widget, "Misc")
+            tab_index = self.addTab(misc_tab_widget, "Misc")
+            self._index_tab_fields(tab_index, misc_fields)
 
         # Add single DX11 tab if there are DX11 fields
         if dx11_fields:
@@ -372,6 +377,7 @@ class CategoryTabWidget(MultiRowTabWidget):
                 "DX11 - Config_DX11.ini", dx11_fields
             )
             tab_index = self.addTab(dx11_tab_widget, "Config_DX11.ini")
+            self._index_tab_fields(tab_index, dx11_fields)
             self.dx11_tab_indices.append(tab_index)
             self._apply_dx11_button_styling(tab_index)
 
@@ -933,6 +939,18 @@ class CategoryTabWidget(MultiRowTabWidget):
             return (0, 0)
         return (self.current_search_index + 1, len(self.highlighted_fields))
 
+    def _index_tab_fields(self, tab_index: int, field_paths: List[str]) -> None:
+        """
+        Record which tab holds each field that got a widget.
+
+        Args:
+            tab_index: Index of the tab
+            field_paths: Field paths placed on the tab
+        """
+        for field_path in field_paths:
+            if field_path in self.field_widgets:
+                self.field_tab_indices[field_path] = tab_index
+
     def switch_to_field_tab(self, field_path: str) -> None:
         """
         Switch to the tab containing the specified field.
@@ -943,6 +961,16 @@ class CategoryTabWidget(MultiRowTabWidget):
         if not self.config_model:
             return
 
+        # Fast path: tab recorded when the field widget was created
+        tab_index = self.field_tab_indices.get(field_path)
+        if tab_index is not None:
+            if tab_index != self.currentIndex():
+                self.setCurrentIndex(tab_index)
+            field_widget = self.field_widgets.get(field_path)
+            if field_widget:
+                field_widget.scroll_into_view()
+            return
+
         # Get field info to determine category
         field_info = self.config_model.get_field_info(field_path)
         if not field_info:
@@ -997,6 +1025,18 @@ class CategoryTabWidget(MultiRowTabWidget):
         for field_widget in self.field_widgets.values():
             field_widget.refresh_from_model()
 
+    def refresh_fields(self, field_paths: Iterable[str]) -> None:
+        """
+        Refresh only the given field widgets from the model.
+
+        Args:
+            field_paths: Paths of the fields to refresh
+        """
+        for field_path in field_paths:
+            field_widget = self.field_widgets.get(field_path)
+            if field_widget:
+                field_widget.refresh_from_model()
+
     def get_current_category(self) -> str:
         """
         Get the name of the currently selected category.
@@ -63,6 +63,7 @@ class ConfigurationPanel(QWidget):
         self.open_settings_button: Optional[QPushButton] = None # New button
         self.apply_changes_button_widget = apply_button_widget
         self.search_widget: Optional[SearchWidget] = None # Add SearchWidget member
+        self.actions_enabled = True  # False while a profile load is in progress
 
         self.setup_ui()
         self.setup_connections()
@@ -212,11 +213,21 @@ class ConfigurationPanel(QWidget):
 
     def on_selection_changed(self) -> None:
         """Handle configuration list selection changes."""
-        has_selection = bool(self.config_list.currentItem())
+        has_selection = bool(self.config_list.currentItem()) and self.actions_enabled
         self.load_button.setEnabled(has_selection)
         self.compare_button.setEnabled(has_selection)
         self.delete_button.setEnabled(has_selection)
 
+    def set_actions_enabled(self, enabled: bool) -> None:
+        """
+        Enable or disable the load, compare and delete actions.
+
+        Args:
+            enabled: False to block the actions regardless of the selection
+        """
+        self.actions_enabled = enabled
+        self.on_selection_changed()
+
     def on_load_clicked(self) -> None:
         """Handle load button click."""
         current_item = self.config_list.currentItem()
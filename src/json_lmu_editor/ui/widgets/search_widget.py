@@ -8,7 +8,7 @@ from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLineEdit, QPushB
 from PyQt6.QtCore import QTimer, pyqtSignal, Qt
 from PyQt6.QtGui import QKeySequence, QShortcut, QFont
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
 from ...core.optimizations.search_indexer import SearchIndexer
 
@@ -28,8 +28,10 @@ class SearchWidget(QWidget):
         self.logger = logging.getLogger(__name__)
 
         # Search state
-        self.current_results = []
+        self.current_results: Tuple[str, ...] = ()
         self.current_index = -1
+        # "/N results" part of the counter, fixed for the current result set
+        self._result_suffix = ""
 
         # Search indexer for performance
         self.search_indexer: Optional[SearchIndexer] = None
@@ -108,7 +110,7 @@ class SearchWidget(QWidget):
         """Set up signal connections."""
         # Search input changes
         self.search_input.textChanged.connect(self.on_search_text_changed)
-        self.search_input.returnPressed.connect(self.navigate_next)
+        self.search_input.returnPressed.connect(self.on_return_pressed)
 
         # Navigation buttons
         self.prev_button.clicked.connect(self.navigate_previous)
@@ -140,7 +142,7 @@ class SearchWidget(QWidget):
         if text.strip():
             if len(text) >= 2:  # Minimum search length
                 # Start timer for debounced search
-                self.search_timer.start(300)  # 300ms delay
+                self.search_timer.start(self.get_search_delay(text))
             else:
                 self.result_label.setText("Type at least 2 characters")
                 self.update_navigation_buttons(False)
@@ -148,6 +150,33 @@ class SearchWidget(QWidget):
             # Clear search
             self.clear_search()
 
+    def get_search_delay(self, text: str) -> int:
+        """
+        Get the debounce delay for a query.
+
+        Longer queries are more selective and cheap to search, so they fire
+        sooner. Short prefixes on large indexes keep the original 300 ms; this
+        is the only debounce before the search runs.
+
+        Args:
+            text: Current search text
+
+        Returns:
+            Delay in milliseconds
+        """
+        if len(text) >= 4:
+            return 150
+        index_size = self.search_indexer.field_count if self.search_indexer else 0
+        return 300 if index_size > 5000 else 250
+
+    def on_return_pressed(self) -> None:
+        """Submit a pending search immediately, otherwise go to the next result."""
+        if self.search_timer.isActive():
+            self.search_timer.stop()
+            self.perform_search()
+        else:
+            self.navigate_next()
+
     def perform_search(self) -> None:
         """Perform the actual search."""
         query = self.search_input.text().strip()
@@ -167,8 +196,11 @@ class SearchWidget(QWidget):
         Args:
             results: List of search result field paths
         """
-        self.current_results = results
+        # Own an immutable copy so callers can reuse or clear their list
+        self.current_results = tuple(results)
         self.current_index = 0 if results else -1
+        total = len(self.current_results)
+        self._result_suffix = "/1 result" if total == 1 else f"/{total} results"
 
         # Update result counter and navigation
         self.update_result_counter()
@@ -177,13 +209,8 @@ class SearchWidget(QWidget):
     def update_result_counter(self) -> None:
         """Update the result counter display."""
         if self.current_results:
-            if len(self.current_results) == 1:
-                self.result_label.setText("1/1 result")
-            else:
-                current_pos = self.current_index + 1 if self.current_index >= 0 else 1
-                self.result_label.setText(
-                    f"{current_pos}/{len(self.current_results)} results"
-                )
+            current_pos = self.current_index + 1 if self.current_index >= 0 else 1
+            self.result_label.setText(f"{current_pos}{self._result_suffix}")
         else:
             query = self.search_input.text().strip()
             if query:
@@ -198,27 +225,30 @@ class SearchWidget(QWidget):
         Args:
             enabled: Whether navigation should be enabled
         """
+        # Tooltips stay static; the result label already shows the position
         has_results = enabled and len(self.current_results) > 0
         self.prev_button.setEnabled(has_results)
         self.next_button.setEnabled(has_results)
 
-        # Update button tooltips with position info
-        if has_results and len(self.current_results) > 1:
-            position_text = f"({self.current_index + 1}/{len(self.current_results)})"
-            self.prev_button.setToolTip(f"Previous result {position_text} (Shift+F3)")
-            self.next_button.setToolTip(f"Next result {position_text} (F3)")
-        else:
-            self.prev_button.setToolTip("Previous result (Shift+F3)")
-            self.next_button.setToolTip("Next result (F3)")
+    def set_position(self, current_index: int) -> None:
+        """
+        Update the current result position without rebuilding navigation state.
+
+        Args:
+            current_index: Zero-based index of the current result
+        """
+        self.current_index = current_index
+        if len(self.current_results) <= 1:
+            return
+
+        self.result_label.setText(f"{current_index + 1}{self._result_suffix}")
 
     def navigate_previous(self) -> None:
         """Navigate to previous search result."""
         if not self.current_results:
             return
 
-        self.current_index = (self.current_index - 1) % len(self.current_results)
-        self.update_result_counter()
-        self.update_navigation_buttons(True)
+        self.set_position((self.current_index - 1) % len(self.current_results))
         self.result_navigation.emit(-1)
 
     def navigate_next(self) -> None:
@@ -226,16 +256,14 @@ class SearchWidget(QWidget):
         if not self.current_results:
             return
 
-        self.current_index = (self.current_index + 1) % len(self.current_results)
-        self.update_result_counter()
-        self.update_navigation_buttons(True)
+        self.set_position((self.current_index + 1) % len(self.current_results))
         self.result_navigation.emit(1)
 
     def clear_search(self) -> None:
         """Clear the search."""
         self.search_input.clear()
         self.result_label.setText("")
-        self.current_results = []
+        self.current_results = ()
         self.current_index = -1
         self.update_navigation_buttons(False)
         self.clear_button.setEnabled(False)